@@ -0,0 +1,227 @@
+# category_charts.py
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+from utils.chart_helpers import (
+    cached_standardized_customdata,
+    sort_by_metric,
+    ensure_column_major,
+    dataframe_fingerprint,
+    get_or_build_figure,
+    downcast_for_plotting,
+    top_n_positions,
+    TREEMAP_MAX_TILES,
+    to_arrow_table,
+    PROFIT_METRICS
+)
+from utils.chart_styles import create_column_config
+from utils.processors import CHART_METRICS
+
+def render_category_tab(filtered_df, column_name, aggregate_fn, render_chart, color_scale, chart_type, category_label, widget_key):
+    """
+    Renders a single-dimension category tab (treemap/bar chart plus data table).
+
+    Args:
+        filtered_df: DataFrame with filtered time record data
+        column_name: Category column to analyze (e.g. "Price model")
+        aggregate_fn: Function to aggregate data by the category column; must accept
+            return_zero_counts=True and then return (aggregate, per-metric zero counts)
+        render_chart: Function to render charts with consistent styling
+        color_scale: Plotly continuous color scale for the charts
+        chart_type: Chart type passed to render_chart and used to namespace session state
+        category_label: Plural, lower-case name of the categories (e.g. "price models")
+        widget_key: Function mapping a base widget key to the tab's widget key
+    """
+    # Check if the category column exists
+    if column_name not in filtered_df.columns:
+        st.warning(f"{column_name} information is not available in the data.")
+        return
+
+    # Group on integer category codes instead of hashing strings row by row.
+    # A shallow copy keeps the caller's frame untouched without copying its data.
+    if not isinstance(filtered_df[column_name].dtype, pd.CategoricalDtype):
+        filtered_df = filtered_df.copy(deep=False)
+        filtered_df[column_name] = filtered_df[column_name].astype("category")
+
+    # Aggregate by category first - this will be used for all visualizations
+    category_agg, zero_counts = aggregate_fn(filtered_df, return_zero_counts=True)
+    category_agg = ensure_column_major(category_agg)
+
+    # Check if we have any data after aggregation
+    if category_agg.empty:
+        st.error(f"No {column_name.lower()} data available after filtering.")
+        return
+
+    title_name = column_name.title()
+
+    # Metric options shared with count_zero_groups, so excluded counts match the chart
+    metric_options = CHART_METRICS
+
+    # Create columns for horizontal alignment
+    col1, col2 = st.columns(2)
+
+    with col1:
+        selected_metric = st.selectbox(
+            "Select metric to visualize:",
+            options=metric_options,
+            index=0,  # Default to Hours worked
+            key=widget_key("metric_selector")
+        )
+
+    with col2:
+        # Add visualization type selection
+        visualization_options = ["Treemap", "Bar chart"]
+
+        visualization_type = st.radio(
+            "Visualization type:",
+            options=visualization_options,
+            index=0,  # Default to Treemap
+            key=widget_key("visualization_selector"),
+            horizontal=True
+        )
+
+    is_profit = selected_metric in PROFIT_METRICS
+
+    # Sort by hours worked once - shared by the data table and, for the default
+    # metric, by both charts; other metrics get one sort reused by both charts
+    sorted_category_agg = sort_by_metric(category_agg, "Hours worked")
+    if selected_metric == "Hours worked":
+        sorted_by_metric = sorted_category_agg
+    else:
+        sorted_by_metric = sort_by_metric(category_agg, selected_metric)
+
+    # Filter based on selected metric - special handling for profit which can be negative
+    # The excluded count comes with the aggregate; only the row mask is built here
+    metric_values = sorted_by_metric[selected_metric].to_numpy()
+    if is_profit:
+        keep_mask = metric_values != 0
+    else:
+        keep_mask = metric_values > 0
+    excluded_count = int(zero_counts[selected_metric])
+    filtered_category_agg = sorted_by_metric.iloc[keep_mask]
+
+    # Show warning if some categories were filtered out
+    if excluded_count > 0:
+        st.warning(f"{excluded_count} {category_label} with zero {selected_metric} were excluded from visualization.")
+
+    # Fingerprint the aggregate so figures can be reused across no-op reruns
+    agg_fingerprint = dataframe_fingerprint(category_agg)
+    figure_state_key = f"{chart_type}_figure"
+
+    def all_custom_data():
+        # Built once per sorted frame (cached) and sliced by each chart
+        return cached_standardized_customdata(sorted_by_metric, "float32")
+
+    # Render visualization based on type
+    if not filtered_category_agg.empty:
+        if visualization_type == "Treemap":
+            # Cap the treemap to its largest tiles; a slider lifts the cap for large category sets
+            treemap_limit = len(filtered_category_agg)
+            if treemap_limit > TREEMAP_MAX_TILES:
+                treemap_limit = st.slider(
+                    f"Number of {category_label} in treemap:",
+                    min_value=1,
+                    max_value=len(filtered_category_agg),
+                    value=TREEMAP_MAX_TILES,
+                    step=1,
+                    key=widget_key("treemap_slider")
+                )
+
+            def build_treemap():
+                # Positions of the kept rows within sorted_by_metric, capped to the largest tiles
+                treemap_positions = np.flatnonzero(keep_mask)
+                if len(treemap_positions) > treemap_limit:
+                    top_positions = top_n_positions(metric_values[treemap_positions], treemap_limit, by_magnitude=is_profit)
+                    treemap_positions = treemap_positions[top_positions]
+
+                # Plot on a float32 copy; the data table keeps full precision
+                plot_df = downcast_for_plotting(sorted_by_metric.iloc[treemap_positions])
+                fig = px.treemap(
+                    plot_df,
+                    path=[column_name],
+                    values=selected_metric,
+                    color=selected_metric,
+                    color_continuous_scale=color_scale,
+                    custom_data=all_custom_data()[:, treemap_positions],
+                    title=f"{title_name} {selected_metric} Distribution"
+                )
+                return fig
+
+            fig = get_or_build_figure(
+                figure_state_key,
+                ("Treemap", selected_metric, treemap_limit, agg_fingerprint),
+                build_treemap
+            )
+            render_chart(fig, chart_type)
+
+        elif visualization_type == "Bar chart":
+            # Categories are already sorted by the selected metric in descending order
+            sorted_categories = sorted_by_metric
+
+            # Slider bounds depend only on the number of categories
+            row_count = len(category_agg)
+            max_rows = min(1000, row_count)
+            default_rows = min(10, row_count)
+
+            # Add a slider to control number of categories to display
+            if row_count > 1:
+                num_categories = st.slider(
+                    f"Number of {category_label} to display:",
+                    min_value=1,
+                    max_value=max_rows,
+                    value=default_rows,
+                    step=1,
+                    key=widget_key("count_slider")
+                )
+                # Limit the number of categories based on slider
+                limited_categories = sorted_categories.iloc[:num_categories]
+            else:
+                # If only one category, no need for slider
+                limited_categories = sorted_categories
+
+            # Create the bar chart with standardized custom data
+            def build_bar_chart():
+                plot_df = downcast_for_plotting(limited_categories)
+                fig_bar = px.bar(
+                    plot_df,
+                    x=column_name,
+                    y=selected_metric,
+                    color=selected_metric,
+                    color_continuous_scale=color_scale,
+                    title=f"{selected_metric} by {title_name}",
+                    custom_data=all_custom_data()[:, :len(limited_categories)]
+                )
+
+                # Improve layout for better readability
+                fig_bar.update_layout(
+                    xaxis_title="",
+                    yaxis_title=selected_metric,
+                    xaxis={'categoryorder':'total descending'}
+                )
+                return fig_bar
+
+            fig_bar = get_or_build_figure(
+                figure_state_key,
+                ("Bar chart", selected_metric, len(limited_categories), agg_fingerprint),
+                build_bar_chart
+            )
+
+            # Render the chart (this will apply styling from chart_styles)
+            render_chart(fig_bar, chart_type)
+    else:
+        if is_profit:
+            st.error(f"No {category_label} have non-zero values for {selected_metric}.")
+        else:
+            st.error(f"No {category_label} have values greater than zero for {selected_metric}.")
+
+    # Display category data table with all metrics
+    # Collapsed by default so the grid is only laid out when the user opens it
+    with st.expander(f"{title_name} Data Table", expanded=False):
+        # Display the table with the column configuration from chart_styles
+        st.dataframe(
+            to_arrow_table(sorted_category_agg),
+            use_container_width=True,
+            hide_index=True,
+            column_config=create_column_config(sorted_category_agg)
+        )
@@ -1,56 +1,39 @@
 # charts/summary_charts.py
 import streamlit as st
 import pandas as pd
+import heapq
+from operator import itemgetter
 from datetime import datetime
 import numpy as np
 from typing import Dict, Any, List, Tuple
 from utils.chart_styles import get_currency_formatting
 from utils.currency_formatter import format_millions, get_currency_code, CURRENCY_SYMBOLS
 
-def render_summary_tab(
-    filtered_df: pd.DataFrame,
-    filter_settings: Dict[str, Any]
-) -> None:
-    """
-    Renders a matrix of project performance data.
-    
-    Args:
-        filtered_df: DataFrame with filtered time record data
-        filter_settings: Dictionary containing all active filter settings
-    """
-    
-    # Check if dataframe is empty
-    if filtered_df.empty:
-        st.warning("No data available with the current filter settings. Please adjust your filters to see a summary.")
-        return
-    
-    # Generate filter description
-    filter_description = generate_filter_description(filter_settings)
-    
-    # Calculate key metrics
-    total_hours = filtered_df["Hours worked"].sum()
-    total_billable_hours = filtered_df["Billable hours"].sum()
-    billability_percentage = (total_billable_hours / total_hours * 100) if total_hours > 0 else 0
-    total_projects = filtered_df["Project number"].nunique()
-    
-    # Revenue metrics (if hourly rate exists)
-    has_revenue = "Hourly rate" in filtered_df.columns
-    total_revenue = None
-    if has_revenue:
-        total_revenue = (filtered_df["Billable hours"] * filtered_df["Hourly rate"]).sum()
-        avg_hourly_rate = total_revenue / total_billable_hours if total_billable_hours > 0 else 0
-    
-    # Get data for matrix
-    customer_insights = get_customer_insights(filtered_df, top_n=10)
-    project_insights = get_top_projects(filtered_df, top_n=10)
-    project_type_insights = get_project_type_insights(filtered_df, top_n=10)
-    phase_insights = get_phase_insights(filtered_df, top_n=10)
-    activity_insights = get_activity_insights(filtered_df, top_n=10)
-    
-    st.markdown("<hr>", unsafe_allow_html=True)
-    
-    # Define card styles once
-    st.markdown("""
+# Grouping keys of the insight helpers, converted to Categorical before aggregating
+INSIGHT_KEY_COLUMNS = ("Customer name", "Project", "Project type", "Phase", "Activity",
+                       "Customer number", "Project number")
+
+# Numeric columns read by the insight helpers ("_rev" comes from with_row_revenue)
+INSIGHT_VALUE_COLUMNS = ("Hours worked", "Billable hours", "Hourly rate", "_rev")
+
+# Columns needed for revenue and hourly rate metrics
+REVENUE_COLUMNS = frozenset({"Hourly rate", "Billable hours"})
+
+# Insight dictionary keys of the revenue metrics, by aggregated column
+REVENUE_INSIGHT_COLUMNS = {"Revenue": "revenue", "Rate": "rate"}
+
+# Markup of one ranked entry in a summary card, filled per item with format_map
+CARD_ITEM_TEMPLATE = """
+            <div style="margin-bottom: 8px;">
+                <div style="font-weight: bold;">{rank}. {name}</div>
+                <div>{detail}</div>
+            </div>
+        """
+
+# Card and matrix styles of the summary tab, preceded by the section divider.
+# Streamlit drops elements a rerun does not emit, so this is sent on every run.
+SUMMARY_CARD_CSS = """
+        <hr>
         <style>
         .card-container {
             background-color: #f8f9fa;
@@ -88,183 +71,155 @@ def render_summary_tab(
             margin-bottom: 5px;
             font-size: 1.3rem;
         }
+        .summary-grid {
+            display: grid;
+            grid-template-columns: repeat(3, 1fr);
+            column-gap: 1rem;
+        }
+        .summary-grid.hours-only {
+            grid-template-columns: 1fr;
+        }
+        .summary-grid .row-header {
+            grid-column: 1 / -1;
+        }
         </style>
-    """, unsafe_allow_html=True)
-    
-    # Create matrix layout headers
-    col_headers = st.columns(3)
-    with col_headers[0]:
-        st.markdown('<div class="matrix-header">💰 Revenue</div>', unsafe_allow_html=True)
-    with col_headers[1]:
-        st.markdown('<div class="matrix-header">⏱️ Hours Worked</div>', unsafe_allow_html=True)
-    with col_headers[2]:
-        st.markdown('<div class="matrix-header">💲 Avg. Hourly Rate</div>', unsafe_allow_html=True)
-        
-    # Row 1: Customers
-    st.markdown('<div class="row-header">🏢 Customers</div>', unsafe_allow_html=True)
-    cols = st.columns(3)
-    
-    # Revenue
-    with cols[0]:
-        create_card(
-            title="Top Customers by Revenue",
-            content=render_by_revenue(customer_insights.get("top_customers", []), has_revenue, "customer"),
-            show_data=has_revenue and len(customer_insights.get("top_customers", [])) > 0
-        )
-    
-    # Hours
-    with cols[1]:
-        create_card(
-            title="Top Customers by Hours",
-            content=render_by_hours(customer_insights.get("top_customers", []), "customer"),
-            show_data=len(customer_insights.get("top_customers", [])) > 0
-        )
-    
-    # Rate
-    with cols[2]:
-        create_card(
-            title="Top Customers by Hourly Rate",
-            content=render_by_rate(customer_insights.get("top_customers", []), has_revenue, "customer"),
-            show_data=has_revenue and len(customer_insights.get("top_customers", [])) > 0
-        )
-    
-    # Row 2: Projects
-    st.markdown('<div class="row-header">📋 Projects</div>', unsafe_allow_html=True)
-    cols = st.columns(3)
-    
-    # Revenue
-    with cols[0]:
-        create_card(
-            title="Top Projects by Revenue",
-            content=render_by_revenue(project_insights, has_revenue, "project"),
-            show_data=has_revenue and len(project_insights) > 0
-        )
-    
-    # Hours
-    with cols[1]:
-        create_card(
-            title="Top Projects by Hours",
-            content=render_by_hours(project_insights, "project"),
-            show_data=len(project_insights) > 0
-        )
-    
-    # Rate
-    with cols[2]:
-        create_card(
-            title="Top Projects by Hourly Rate",
-            content=render_by_rate(project_insights, has_revenue, "project"),
-            show_data=has_revenue and len(project_insights) > 0
-        )
-    
-    # Row 3: Project Types
-    st.markdown('<div class="row-header">📊 Project Types</div>', unsafe_allow_html=True)
-    cols = st.columns(3)
-    
-    # Revenue
-    with cols[0]:
-        create_card(
-            title="Top Project Types by Revenue",
-            content=render_by_revenue(project_type_insights.get("top_project_types", []), has_revenue, "project_type"),
-            show_data=has_revenue and len(project_type_insights.get("top_project_types", [])) > 0
-        )
-    
-    # Hours
-    with cols[1]:
-        create_card(
-            title="Top Project Types by Hours",
-            content=render_by_hours(project_type_insights.get("top_project_types", []), "project_type"),
-            show_data=len(project_type_insights.get("top_project_types", [])) > 0
-        )
-    
-    # Rate
-    with cols[2]:
-        create_card(
-            title="Top Project Types by Hourly Rate",
-            content=render_by_rate(project_type_insights.get("top_project_types", []), has_revenue, "project_type"),
-            show_data=has_revenue and len(project_type_insights.get("top_project_types", [])) > 0
-        )
-    
-    # Row 4: Phases
-    st.markdown('<div class="row-header">🔄 Phases</div>', unsafe_allow_html=True)
-    cols = st.columns(3)
-    
-    # Revenue
-    with cols[0]:
-        create_card(
-            title="Top Phases by Revenue",
-            content=render_by_revenue(phase_insights.get("top_phases", []), has_revenue, "phase"),
-            show_data=has_revenue and len(phase_insights.get("top_phases", [])) > 0
-        )
-    
-    # Hours
-    with cols[1]:
-        create_card(
-            title="Top Phases by Hours",
-            content=render_by_hours(phase_insights.get("top_phases", []), "phase"),
-            show_data=len(phase_insights.get("top_phases", [])) > 0
-        )
-    
-    # Rate
-    with cols[2]:
-        create_card(
-            title="Top Phases by Hourly Rate",
-            content=render_by_rate(phase_insights.get("top_phases", []), has_revenue, "phase"),
-            show_data=has_revenue and len(phase_insights.get("top_phases", [])) > 0
-        )
+    """
+
+
+def render_summary_tab(
+    filtered_df: pd.DataFrame,
+    filter_settings: Dict[str, Any],
+    data_key: Tuple
+) -> None:
+    """
+    Renders a matrix of project performance data.
     
-    # Row 5: Activities
-    st.markdown('<div class="row-header">🔨 Activities</div>', unsafe_allow_html=True)
-    cols = st.columns(3)
+    Args:
+        filtered_df: DataFrame with filtered time record data
+        filter_settings: Dictionary containing all active filter settings
+        data_key: Tuple of (source data fingerprint, frozen filter settings) identifying filtered_df
+    """
     
-    # Revenue
-    with cols[0]:
-        create_card(
-            title="Top Activities by Revenue",
-            content=render_by_revenue(activity_insights.get("top_activities", []), has_revenue, "activity"),
-            show_data=has_revenue and len(activity_insights.get("top_activities", [])) > 0
-        )
+    # Check if dataframe is empty
+    if filtered_df.empty:
+        st.warning("No data available with the current filter settings. Please adjust your filters to see a summary.")
+        return
     
-    # Hours
-    with cols[1]:
-        create_card(
-            title="Top Activities by Hours",
-            content=render_by_hours(activity_insights.get("top_activities", []), "activity"),
-            show_data=len(activity_insights.get("top_activities", [])) > 0
-        )
+    # Revenue columns are only shown if hourly rate exists
+    has_revenue = REVENUE_COLUMNS.issubset(filtered_df.columns)
+    
+    # Get data for matrix, cached on the dashboard's data key so reruns never touch the rows
+    insights = cached_summary_insights(data_key, filtered_df, top_n=10)
+    customer_insights = insights["customers"]
+    project_insights = insights["projects"]
+    project_type_insights = insights["project_types"]
+    phase_insights = insights["phases"]
+    activity_insights = insights["activities"]
+    
+    # Styles and divider go out in one element; the CSS string is built once at import
+    st.markdown(SUMMARY_CARD_CSS, unsafe_allow_html=True)
+    
+    # One row per insight grouping: (row header, card label, items, item type)
+    matrix_rows = [
+        ("🏢 Customers", "Customers", customer_insights.get("top_customers", []), "customer"),
+        ("📋 Projects", "Projects", project_insights, "project"),
+        ("📊 Project Types", "Project Types", project_type_insights.get("top_project_types", []), "project_type"),
+        ("🔄 Phases", "Phases", phase_insights.get("top_phases", []), "phase"),
+        ("🔨 Activities", "Activities", activity_insights.get("top_activities", []), "activity")
+    ]
+    
+    # Build the whole matrix as one CSS grid and send it in a single element.
+    # Without revenue data only the hours column is rendered.
+    if has_revenue:
+        grid_parts = [
+            '<div class="summary-grid">',
+            '<div class="matrix-header">💰 Revenue</div>',
+            '<div class="matrix-header">⏱️ Hours Worked</div>',
+            '<div class="matrix-header">💲 Avg. Hourly Rate</div>'
+        ]
+    else:
+        grid_parts = [
+            '<div class="summary-grid hours-only">',
+            '<div class="matrix-header">⏱️ Hours Worked</div>'
+        ]
+    for row_header, label, items, item_type in matrix_rows:
+        has_items = len(items) > 0
+        grid_parts.append(f'<div class="row-header">{row_header}</div>')
+        if has_revenue:
+            grid_parts.append(card_html(
+                title=f"Top {label} by Revenue",
+                content=render_by_revenue(items, has_revenue, item_type),
+                show_data=has_items
+            ))
+        grid_parts.append(card_html(
+            title=f"Top {label} by Hours",
+            content=render_by_hours(items, item_type),
+            show_data=has_items
+        ))
+        if has_revenue:
+            grid_parts.append(card_html(
+                title=f"Top {label} by Hourly Rate",
+                content=render_by_rate(items, has_revenue, item_type),
+                show_data=has_items
+            ))
+    grid_parts.append('</div>')
+    
+    st.markdown("".join(grid_parts), unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False)
+def cached_summary_insights(data_key: Tuple, _df: pd.DataFrame, top_n: int = 10) -> Dict[str, Any]:
+    """
+    Computes all insight groupings for the summary matrix, cached across reruns.
     
-    # Rate
-    with cols[2]:
-        create_card(
-            title="Top Activities by Hourly Rate",
-            content=render_by_rate(activity_insights.get("top_activities", []), has_revenue, "activity"),
-            show_data=has_revenue and len(activity_insights.get("top_activities", [])) > 0
-        )
+    Args:
+        data_key: Tuple of (source data fingerprint, frozen filter settings) identifying _df
+        _df: Filtered DataFrame (not hashed by Streamlit; identified by data_key)
+        top_n: Number of top items per grouping
+        
+    Returns:
+        Dictionary with customer, project, project type, phase and activity insights
+    """
+    # Row-level revenue is computed once and shared by all insight helpers;
+    # only the columns the helpers read are kept
+    _df = select_insight_columns(with_row_revenue(_df))
+    
+    # Group on integer category codes instead of hashing strings row by row
+    _df = with_categorical_keys(_df)
+    
+    return {
+        "customers": get_customer_insights(_df, top_n=top_n),
+        "projects": get_top_projects(_df, top_n=top_n),
+        "project_types": get_project_type_insights(_df, top_n=top_n),
+        "phases": get_phase_insights(_df, top_n=top_n),
+        "activities": get_activity_insights(_df, top_n=top_n)
+    }
 
 
-def create_card(title: str, content: str, show_data: bool = True) -> None:
+def card_html(title: str, content: str, show_data: bool = True) -> str:
     """
-    Creates a card-like container for displaying information.
+    Builds the HTML of a card-like container for the summary matrix.
     
     Args:
         title: Card title
-        content: Card content (HTML/markdown)
+        content: Card content (HTML)
         show_data: Whether to show data or a placeholder message
+    
+    Returns:
+        Single-line HTML string, so the card stays one markdown HTML block
     """
-    # Create the card HTML
-    if show_data:
-        st.markdown(f"""
-            <div class="card-container">
-                <div class="card-title">{title}</div>
-                <div class="card-content">
-                    {content}
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown(f"""
-            <div class="card-container">
-                <div class="card-title">{title}</div>
-                <div class="card-content">
-                    <div class="no-data">No data available</div>
-        """, unsafe_allow_html=True)
+    if not show_data:
+        content = '<div class="no-data">No data available</div>'
+    
+    # Drop line breaks and indentation; a blank line would end the HTML block
+    content = "".join(line.strip() for line in content.splitlines())
+    
+    return (
+        f'<div class="card-container">'
+        f'<div class="card-title">{title}</div>'
+        f'<div class="card-content">{content}</div>'
+        f'</div>'
+    )
 
 
 def render_by_revenue(items: List[Dict[str, Any]], has_revenue: bool, item_type: str) -> str:
@@ -282,14 +237,12 @@ def render_by_revenue(items: List[Dict[str, Any]], has_revenue: bool, item_type:
     if not items or not has_revenue:
         return "<div class='no-data'>No revenue data available</div>"
     
-    # Sort items by revenue if present
-    sorted_items = sorted(items, key=lambda x: x.get('revenue', 0), reverse=True)
+    # Take the ten highest-revenue items (the helpers already trimmed the list;
+    # every item carries float "hours", "revenue" and "rate" keys)
+    top_items = heapq.nlargest(10, items, key=itemgetter('revenue'))
     
-    html = ""
-    for i, item in enumerate(sorted_items[:10]):
-        if "revenue" not in item:
-            continue
-            
+    parts = []
+    for i, item in enumerate(top_items):
         item_name = item.get('name', '')
         revenue = format_millions(item['revenue'])
         
@@ -298,14 +251,13 @@ def render_by_revenue(items: List[Dict[str, Any]], has_revenue: bool, item_type:
         if "revenue_percentage" in item:
             percentage_text = f" ({item['revenue_percentage']:.1f}% of total)"
         
-        html += f"""
-            <div style="margin-bottom: 8px;">
-                <div style="font-weight: bold;">{i+1}. {item_name}</div>
-                <div>{revenue}{percentage_text}</div>
-            </div>
-        """
+        parts.append(CARD_ITEM_TEMPLATE.format_map({
+            "rank": i + 1,
+            "name": item_name,
+            "detail": revenue + percentage_text
+        }))
     
-    return html if html else "<div class='no-data'>No revenue data available</div>"
+    return "".join(parts) if parts else "<div class='no-data'>No revenue data available</div>"
 
 
 def render_by_hours(items: List[Dict[str, Any]], item_type: str) -> str:
@@ -322,14 +274,11 @@ def render_by_hours(items: List[Dict[str, Any]], item_type: str) -> str:
     if not items:
         return "<div class='no-data'>No hours data available</div>"
     
-    # Sort items by hours if present
-    sorted_items = sorted(items, key=lambda x: x.get('hours', 0), reverse=True)
+    # Take the ten items with the most hours (the helpers already trimmed the list)
+    top_items = heapq.nlargest(10, items, key=itemgetter('hours'))
     
-    html = ""
-    for i, item in enumerate(sorted_items[:10]):
-        if "hours" not in item:
-            continue
-            
+    parts = []
+    for i, item in enumerate(top_items):
         item_name = item.get('name', '')
         # Format hours as whole number with space as thousand separator
         hours = f"{int(item['hours']):,}".replace(',', ' ') + " hours"
@@ -343,14 +292,13 @@ def render_by_hours(items: List[Dict[str, Any]], item_type: str) -> str:
         elif item_type == "project_type" and "projects" in item:
             context_text = f" ({item['projects']} projects)"
         
-        html += f"""
-            <div style="margin-bottom: 8px;">
-                <div style="font-weight: bold;">{i+1}. {item_name}</div>
-                <div>{hours}{context_text}</div>
-            </div>
-        """
+        parts.append(CARD_ITEM_TEMPLATE.format_map({
+            "rank": i + 1,
+            "name": item_name,
+            "detail": hours + context_text
+        }))
     
-    return html if html else "<div class='no-data'>No hours data available</div>"
+    return "".join(parts) if parts else "<div class='no-data'>No hours data available</div>"
 
 
 def render_by_rate(items: List[Dict[str, Any]], has_revenue: bool, item_type: str) -> str:
@@ -368,22 +316,16 @@ def render_by_rate(items: List[Dict[str, Any]], has_revenue: bool, item_type: st
     if not items or not has_revenue:
         return "<div class='no-data'>No hourly rate data available</div>"
     
-    # Calculate and add hourly rate if not present
-    for item in items:
-        if "revenue" in item and "hours" in item and "rate" not in item and item["hours"] > 0:
-            item["rate"] = item["revenue"] / item["hours"]
-    
-    # Sort items by rate
-    sorted_items = sorted(items, key=lambda x: x.get('rate', 0) 
-                          if isinstance(x.get('rate', 0), (int, float)) else 0, reverse=True)
+    # Take the ten highest-rate items (the helpers always provide a float "rate")
+    top_items = heapq.nlargest(10, items, key=itemgetter('rate'))
     
     # Get currency formatting
     symbol, position, _ = get_currency_formatting()
     
-    html = ""
-    for i, item in enumerate(sorted_items[:10]):
-        # Skip items with no hourly rate or with zero hours
-        if "rate" not in item or item.get("hours", 0) <= 0:
+    parts = []
+    for i, item in enumerate(top_items):
+        # Skip items with zero hours
+        if item.get("hours", 0) <= 0:
             continue
             
         item_name = item.get('name', '')
@@ -394,14 +336,13 @@ def render_by_rate(items: List[Dict[str, Any]], has_revenue: bool, item_type: st
         else:
             rate = f"{item['rate']:.0f} {symbol}/hour"
         
-        html += f"""
-            <div style="margin-bottom: 8px;">
-                <div style="font-weight: bold;">{i+1}. {item_name}</div>
-                <div>{rate}</div>
-            </div>
-        """
+        parts.append(CARD_ITEM_TEMPLATE.format_map({
+            "rank": i + 1,
+            "name": item_name,
+            "detail": rate
+        }))
     
-    return html if html else "<div class='no-data'>No hourly rate data available</div>"
+    return "".join(parts) if parts else "<div class='no-data'>No hourly rate data available</div>"
 
 
 def generate_filter_description(filter_settings: Dict[str, Any]) -> str:
@@ -471,122 +412,265 @@ def generate_filter_description(filter_settings: Dict[str, Any]) -> str:
         return "Based on all time records, "
 
 
-def get_top_projects(df: pd.DataFrame, top_n: int = 3) -> List[Dict[str, Any]]:
+def select_insight_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Identifies the top projects by revenue.
+    Projects the filtered data onto the columns the insight helpers read.
     
     Args:
         df: Filtered DataFrame
-        top_n: Number of top projects to return
         
     Returns:
-        List of dictionaries with project metrics
+        DataFrame with the available INSIGHT_KEY_COLUMNS and INSIGHT_VALUE_COLUMNS
     """
-    # Check if dataframe is empty or lacks necessary columns
-    if df.empty or "Project" not in df.columns or "Project number" not in df.columns:
-        return []
+    columns = [column for column in INSIGHT_KEY_COLUMNS + INSIGHT_VALUE_COLUMNS if column in df.columns]
+    return df[columns]
+
+
+def with_categorical_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the insight grouping columns from strings to pandas Categorical.
     
-    # Check if we can calculate revenue
-    has_revenue = "Hourly rate" in df.columns and "Billable hours" in df.columns
+    Args:
+        df: Filtered DataFrame
+        
+    Returns:
+        Shallow copy of df with INSIGHT_KEY_COLUMNS stored as Categorical
+        (df itself if there is nothing to convert)
+    """
+    string_keys = [column for column in INSIGHT_KEY_COLUMNS
+                   if column in df.columns and df[column].dtype == object]
+    if not string_keys:
+        return df
+    
+    df = df.copy(deep=False)
+    for column in string_keys:
+        df[column] = df[column].astype("category")
+    return df
+
+
+def with_row_revenue(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds a row-level revenue column ("_rev") used by the insight helpers.
     
-    # Aggregate data by project
-    project_metrics = []
+    Args:
+        df: Filtered DataFrame
+        
+    Returns:
+        DataFrame with "_rev" = Billable hours * Hourly rate, or df unchanged
+        if the column already exists or the inputs are missing
+    """
+    if "_rev" in df.columns or not REVENUE_COLUMNS.issubset(df.columns):
+        return df
     
-    # Group by project and calculate metrics
-    project_agg = df.groupby(["Project number", "Project"]).agg({
-        "Hours worked": "sum",
-        "Billable hours": "sum"
-    }).reset_index()
+    billable_hours = df["Billable hours"].to_numpy(dtype=np.float64, copy=False)
+    hourly_rate = df["Hourly rate"].to_numpy(dtype=np.float64, copy=False)
+    return df.assign(_rev=np.multiply(billable_hours, hourly_rate))
+
+
+def count_distinct_projects(df: pd.DataFrame, keys: List[str]) -> pd.Series:
+    """
+    Counts distinct project numbers per group.
     
-    if has_revenue:
-        # Calculate revenue
-        project_agg["Revenue"] = df.groupby(["Project number"]).apply(
-            lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")["Revenue"]
-        
-        # Calculate hourly rate
-        project_agg["Rate"] = project_agg["Revenue"] / project_agg["Hours worked"].where(project_agg["Hours worked"] > 0, 1)
-        
-        # Calculate total revenue for percentage calculation
-        total_revenue = project_agg["Revenue"].sum()
-    
-    # Create project info dictionaries
-    for _, project in project_agg.iterrows():
-        project_info = {
-            "number": project["Project number"],
-            "name": project["Project"],
-            "hours": project["Hours worked"]
-        }
+    Equivalent to groupby(keys)["Project number"].nunique(), computed as the
+    size of the (keys + project) groups per key, which avoids pandas' slow nunique path.
+    
+    Args:
+        df: Filtered DataFrame
+        keys: Grouping columns
         
-        if has_revenue:
-            project_info["revenue"] = project["Revenue"]
-            project_info["rate"] = project["Rate"]
-            project_info["revenue_percentage"] = (project["Revenue"] / total_revenue * 100) if total_revenue > 0 else 0
+    Returns:
+        Series of distinct project counts indexed by keys
+    """
+    levels = list(range(len(keys)))
+    return df.groupby(keys + ["Project number"], observed=True).size().groupby(level=levels, observed=True).size()
+
+
+def aggregate_by_codes(df: pd.DataFrame, key: str, has_revenue: bool) -> pd.DataFrame:
+    """
+    Sums hours (and row revenue) per category of a Categorical key column.
+    
+    Works directly on the integer category codes with np.bincount, which avoids
+    the groupby machinery; results match groupby(key, observed=True).sum().
+    
+    Args:
+        df: Filtered DataFrame with a Categorical key column
+        key: Grouping column
+        has_revenue: Whether to sum the "_rev" column as well
         
-        project_metrics.append(project_info)
+    Returns:
+        DataFrame with the key, "Hours worked" and (if has_revenue) "_rev" columns
+    """
+    key_values = df[key]
+    categories = key_values.cat.categories
+    codes = key_values.cat.codes.to_numpy()
     
-    return project_metrics
+    # Missing keys (code -1) are dropped, as groupby does
+    valid = codes >= 0
+    codes = codes[valid]
+    
+    columns = ["Hours worked", "_rev"] if has_revenue else ["Hours worked"]
+    
+    # Only categories that occur in the data are kept (observed=True)
+    observed = np.bincount(codes, minlength=len(categories)) > 0
+    result = {key: categories[observed]}
+    for column in columns:
+        # NaN values count as zero, like pandas' skip-NaN sum
+        weights = np.nan_to_num(df[column].to_numpy(dtype=np.float64)[valid])
+        result[column] = np.bincount(codes, weights=weights, minlength=len(categories))[observed]
+    
+    return pd.DataFrame(result)
 
 
-def get_customer_insights(df: pd.DataFrame, top_n: int = 3) -> Dict[str, Any]:
+def to_insight_records(agg: pd.DataFrame, insight_columns: Dict[str, str],
+                       total_revenue: float = None) -> List[Dict[str, Any]]:
     """
-    Extracts key insights about top customers from the filtered data.
+    Converts aggregated rows to insight dictionaries in one call.
     
     Args:
-        df: Filtered DataFrame
-        top_n: Number of top customers to return
+        agg: Aggregated DataFrame
+        insight_columns: Mapping of aggregated column to dictionary key
+        total_revenue: Total revenue for "revenue_percentage" (None without revenue data)
         
     Returns:
-        Dictionary with customer insights
+        List of dictionaries, one per row; "hours", "revenue" and "rate" are always
+        floats (revenue and rate are 0.0 without revenue data)
+    """
+    records = agg[list(insight_columns)].rename(columns=insight_columns)
+    for metric in ("hours", "revenue", "rate"):
+        if metric in records.columns:
+            records[metric] = records[metric].astype(float)
+        else:
+            records[metric] = 0.0
+    if total_revenue is not None:
+        records = records.assign(
+            revenue_percentage=(records["revenue"] / total_revenue * 100) if total_revenue > 0 else 0
+        )
+    return records.to_dict(orient="records")
+
+
+def select_top_rows(agg: pd.DataFrame, top_n: int, has_revenue: bool) -> pd.DataFrame:
     """
-    insights = {}
+    Keeps the aggregated rows that rank in the top_n by hours, revenue or rate.
     
-    # Check if dataframe is empty or lacks necessary columns
-    if df.empty or "Customer number" not in df.columns or "Customer name" not in df.columns:
-        return insights
+    Args:
+        agg: Aggregated DataFrame with a default RangeIndex
+        top_n: Number of top rows per metric
+        has_revenue: Whether the Revenue and Rate columns are present
+        
+    Returns:
+        Union of the top rows per metric, in their original order
+    """
+    metrics = ["Hours worked", "Revenue", "Rate"] if has_revenue else ["Hours worked"]
+    top_index = agg.index[:0]
+    for metric in metrics:
+        top_index = top_index.union(agg[metric].nlargest(top_n).index)
+    return agg.loc[top_index]
+
+
+def compute_insight_records(df: pd.DataFrame, group_cols: Tuple[str, ...], insight_columns: Dict[str, str],
+                            top_n: int, include_projects: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Aggregates hours (and revenue) per group and converts the top rows to insight dictionaries.
     
-    # Calculate customer metrics
-    customer_agg = df.groupby(["Customer number", "Customer name"]).agg({
-        "Hours worked": "sum",
-        "Project number": "nunique"
-    }).reset_index()
+    Shared by all insight helpers: one fused aggregation, vectorized rate and
+    revenue share, top-N trimming and a single to_dict conversion.
     
+    Args:
+        df: Filtered DataFrame (revenue metrics need the "_rev" column from with_row_revenue)
+        group_cols: Grouping columns
+        insight_columns: Mapping of aggregated column to dictionary key (without revenue metrics)
+        top_n: Number of top rows per metric
+        include_projects: Whether to count distinct projects per group (as "Project number")
+        
+    Returns:
+        Tuple of (insight dictionaries for the top rows, total number of groups)
+    """
     # Check if we can calculate revenue
-    has_revenue = "Hourly rate" in df.columns and "Billable hours" in df.columns
+    has_revenue = "_rev" in df.columns
+    
+    # Revenue is summed over all rows in the same pass as hours. Non-billable rows
+    # contribute zero, but filtering them into a separate revenue pass costs more
+    # (an extra mask copy and groupby) than it saves on the fused aggregation.
+    if len(group_cols) == 1 and isinstance(df[group_cols[0]].dtype, pd.CategoricalDtype):
+        # Sum straight over the category codes
+        agg = aggregate_by_codes(df, group_cols[0], has_revenue).set_index(group_cols[0])
+    else:
+        # Calculate metrics (revenue included in the same pass)
+        agg_spec = {
+            "Hours worked": "sum"
+        }
+        if has_revenue:
+            agg_spec["_rev"] = "sum"
+        agg = df.groupby(list(group_cols), observed=True).agg(agg_spec)
     
+    if include_projects:
+        # Count distinct projects per group via a two-level groupby (much faster than nunique)
+        agg["Project number"] = count_distinct_projects(df, list(group_cols))
+    agg = agg.reset_index()
+    
+    total_revenue = None
     if has_revenue:
-        # Calculate revenue by customer
-        customer_agg["Revenue"] = df.groupby(["Customer number"]).apply(
-            lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")["Revenue"]
+        agg = agg.rename(columns={"_rev": "Revenue"})
         
         # Calculate hourly rate
-        customer_agg["Rate"] = customer_agg["Revenue"] / customer_agg["Hours worked"].where(customer_agg["Hours worked"] > 0, 1)
+        agg["Rate"] = agg["Revenue"] / agg["Hours worked"].where(agg["Hours worked"] > 0, 1)
         
-        # Calculate total revenue
-        total_revenue = customer_agg["Revenue"].sum()
-    
-    # Store top customers data
-    top_customers_list = []
-    for _, customer in customer_agg.iterrows():
-        customer_info = {
-            "name": customer["Customer name"],
-            "number": customer["Customer number"],
-            "hours": customer["Hours worked"],
-            "projects": customer["Project number"]
-        }
+        # Calculate total revenue for percentage calculation
+        total_revenue = agg["Revenue"].sum()
         
-        if has_revenue:
-            customer_info["revenue"] = customer["Revenue"]
-            customer_info["rate"] = customer["Rate"]
-            customer_info["revenue_percentage"] = (customer["Revenue"] / total_revenue * 100) if total_revenue > 0 else 0
+        insight_columns = {**insight_columns, **REVENUE_INSIGHT_COLUMNS}
+    
+    # Only rows that can reach a top-N card are converted to dictionaries
+    top_agg = select_top_rows(agg, top_n, has_revenue)
+    
+    return to_insight_records(top_agg, insight_columns, total_revenue), len(agg)
+
+
+def get_top_projects(df: pd.DataFrame, top_n: int = 3) -> List[Dict[str, Any]]:
+    """
+    Identifies the top projects by revenue.
+    
+    Args:
+        df: Filtered DataFrame (revenue metrics need the "_rev" column from with_row_revenue)
+        top_n: Number of top projects to return
         
-        top_customers_list.append(customer_info)
+    Returns:
+        List of dictionaries with project metrics
+    """
+    # Check if dataframe is empty or lacks necessary columns
+    if df.empty or "Project" not in df.columns or "Project number" not in df.columns:
+        return []
     
-    insights["top_customers"] = top_customers_list
-    insights["total_customers"] = len(customer_agg)
+    project_metrics, _ = compute_insight_records(
+        df, ("Project number", "Project"),
+        {"Project number": "number", "Project": "name", "Hours worked": "hours"},
+        top_n
+    )
+    return project_metrics
+
+
+def get_customer_insights(df: pd.DataFrame, top_n: int = 3) -> Dict[str, Any]:
+    """
+    Extracts key insights about top customers from the filtered data.
     
-    return insights
+    Args:
+        df: Filtered DataFrame (revenue metrics need the "_rev" column from with_row_revenue)
+        top_n: Number of top customers to return
+        
+    Returns:
+        Dictionary with customer insights
+    """
+    # Check if dataframe is empty or lacks necessary columns
+    if df.empty or "Customer number" not in df.columns or "Customer name" not in df.columns:
+        return {}
+    
+    top_customers_list, total_customers = compute_insight_records(
+        df, ("Customer number", "Customer name"),
+        {"Customer name": "name", "Customer number": "number", "Hours worked": "hours",
+         "Project number": "projects"},
+        top_n, include_projects=True
+    )
+    return {"top_customers": top_customers_list, "total_customers": total_customers}
 
 
 def get_project_type_insights(df: pd.DataFrame, top_n: int = 3) -> Dict[str, Any]:
@@ -594,66 +678,24 @@ def get_project_type_insights(df: pd.DataFrame, top_n: int = 3) -> Dict[str, Any
     Extracts key insights about project types from the filtered data.
     
     Args:
-        df: Filtered DataFrame
+        df: Filtered DataFrame (revenue is derived from Billable hours and Hourly rate
+            if the "_rev" column from with_row_revenue is missing)
         top_n: Number of top project types to return
         
     Returns:
         Dictionary with project type insights
     """
-    insights = {}
-    
     # Check if dataframe is empty or lacks necessary columns
     if df.empty or "Project type" not in df.columns:
-        return insights
-    
-    # Calculate project type metrics
-    project_type_agg = df.groupby(["Project type"]).agg({
-        "Hours worked": "sum",
-        "Project number": "nunique"
-    }).reset_index()
-    
-    # Check if we can calculate revenue
-    has_revenue = "Hourly rate" in df.columns and "Billable hours" in df.columns
-    
-    if has_revenue:
-        # Calculate revenue directly in the aggregation
-        project_type_revenue = {}
-        
-        # For each project type, calculate total revenue
-        for project_type in df["Project type"].unique():
-            project_df = df[df["Project type"] == project_type]
-            revenue = (project_df["Billable hours"] * project_df["Hourly rate"]).sum()
-            project_type_revenue[project_type] = revenue
-        
-        # Add revenue to aggregated data
-        project_type_agg["Revenue"] = project_type_agg["Project type"].map(project_type_revenue)
-        
-        # Calculate hourly rate
-        project_type_agg["Rate"] = project_type_agg["Revenue"] / project_type_agg["Hours worked"].where(project_type_agg["Hours worked"] > 0, 1)
-        
-        # Calculate total revenue for percentage calculation
-        total_revenue = project_type_agg["Revenue"].sum()
-    
-    # Store top project types data
-    top_project_types_list = []
-    for _, project_type in project_type_agg.iterrows():
-        project_type_info = {
-            "name": project_type["Project type"],
-            "hours": project_type["Hours worked"],
-            "projects": project_type["Project number"]
-        }
-        
-        if has_revenue:
-            project_type_info["revenue"] = project_type["Revenue"]
-            project_type_info["rate"] = project_type["Rate"]
-            project_type_info["revenue_percentage"] = (project_type["Revenue"] / total_revenue * 100) if total_revenue > 0 else 0
-        
-        top_project_types_list.append(project_type_info)
-    
-    insights["top_project_types"] = top_project_types_list
-    insights["total_project_types"] = len(project_type_agg)
-    
-    return insights
+        return {}
+    
+    # Revenue is summed per type in the same pass as hours
+    top_project_types_list, total_project_types = compute_insight_records(
+        with_row_revenue(df), ("Project type",),
+        {"Project type": "name", "Hours worked": "hours", "Project number": "projects"},
+        top_n, include_projects=True
+    )
+    return {"top_project_types": top_project_types_list, "total_project_types": total_project_types}
 
 
 def get_phase_insights(df: pd.DataFrame, top_n: int = 3) -> Dict[str, Any]:
@@ -661,57 +703,20 @@ def get_phase_insights(df: pd.DataFrame, top_n: int = 3) -> Dict[str, Any]:
     Extracts key insights about project phases from the filtered data.
     
     Args:
-        df: Filtered DataFrame
+        df: Filtered DataFrame (revenue metrics need the "_rev" column from with_row_revenue)
         top_n: Number of top phases to return
         
     Returns:
         Dictionary with phase insights
     """
-    insights = {}
-    
     # Check if dataframe is empty or lacks necessary columns
     if df.empty or "Phase" not in df.columns:
-        return insights
-    
-    # Calculate phase metrics
-    phase_agg = df.groupby(["Phase"]).agg({
-        "Hours worked": "sum"
-    }).reset_index()
-    
-    # Check if we can calculate revenue
-    has_revenue = "Hourly rate" in df.columns and "Billable hours" in df.columns
-    
-    if has_revenue:
-        # Calculate revenue by phase
-        phase_agg["Revenue"] = df.groupby(["Phase"]).apply(
-            lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")["Revenue"]
-        
-        # Calculate hourly rate
-        phase_agg["Rate"] = phase_agg["Revenue"] / phase_agg["Hours worked"].where(phase_agg["Hours worked"] > 0, 1)
-        
-        # Calculate total revenue for percentage calculation
-        total_revenue = phase_agg["Revenue"].sum()
-    
-    # Store top phases data
-    top_phases_list = []
-    for _, phase in phase_agg.iterrows():
-        phase_info = {
-            "name": phase["Phase"],
-            "hours": phase["Hours worked"]
-        }
-        
-        if has_revenue:
-            phase_info["revenue"] = phase["Revenue"]
-            phase_info["rate"] = phase["Rate"]
-            phase_info["revenue_percentage"] = (phase["Revenue"] / total_revenue * 100) if total_revenue > 0 else 0
-        
-        top_phases_list.append(phase_info)
-    
-    insights["top_phases"] = top_phases_list
-    insights["total_phases"] = len(phase_agg)
+        return {}
     
-    return insights
+    top_phases_list, total_phases = compute_insight_records(
+        df, ("Phase",), {"Phase": "name", "Hours worked": "hours"}, top_n
+    )
+    return {"top_phases": top_phases_list, "total_phases": total_phases}
 
 
 def get_activity_insights(df: pd.DataFrame, top_n: int = 3) -> Dict[str, Any]:
@@ -719,54 +724,17 @@ def get_activity_insights(df: pd.DataFrame, top_n: int = 3) -> Dict[str, Any]:
     Extracts key insights about activities from the filtered data.
     
     Args:
-        df: Filtered DataFrame
+        df: Filtered DataFrame (revenue metrics need the "_rev" column from with_row_revenue)
         top_n: Number of top activities to return
         
     Returns:
         Dictionary with activity insights
     """
-    insights = {}
-    
     # Check if dataframe is empty or lacks necessary columns
     if df.empty or "Activity" not in df.columns:
-        return insights
-    
-    # Calculate activity metrics
-    activity_agg = df.groupby(["Activity"]).agg({
-        "Hours worked": "sum"
-    }).reset_index()
-    
-    # Check if we can calculate revenue
-    has_revenue = "Hourly rate" in df.columns and "Billable hours" in df.columns
-    
-    if has_revenue:
-        # Calculate revenue by activity
-        activity_agg["Revenue"] = df.groupby(["Activity"]).apply(
-            lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")["Revenue"]
-        
-        # Calculate hourly rate
-        activity_agg["Rate"] = activity_agg["Revenue"] / activity_agg["Hours worked"].where(activity_agg["Hours worked"] > 0, 1)
-        
-        # Calculate total revenue for percentage calculation
-        total_revenue = activity_agg["Revenue"].sum()
-    
-    # Store top activities data
-    top_activities_list = []
-    for _, activity in activity_agg.iterrows():
-        activity_info = {
-            "name": activity["Activity"],
-            "hours": activity["Hours worked"]
-        }
-        
-        if has_revenue:
-            activity_info["revenue"] = activity["Revenue"]
-            activity_info["rate"] = activity["Rate"]
-            activity_info["revenue_percentage"] = (activity["Revenue"] / total_revenue * 100) if total_revenue > 0 else 0
-        
-        top_activities_list.append(activity_info)
-    
-    insights["top_activities"] = top_activities_list
-    insights["total_activities"] = len(activity_agg)
+        return {}
     
-    return insights
\ No newline at end of file
+    top_activities_list, total_activities = compute_insight_records(
+        df, ("Activity",), {"Activity": "name", "Hours worked": "hours"}, top_n
+    )
+    return {"top_activities": top_activities_list, "total_activities": total_activities}
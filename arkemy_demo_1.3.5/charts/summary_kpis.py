@@ -1,20 +1,24 @@
 #summary_kpis.py
 import streamlit as st
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 # Import currency formatter functions
-from utils.currency_formatter import format_currency, format_millions
+from utils.currency_formatter import format_currency, format_millions, get_currency_code
 
-def display_summary_metrics(metrics: Dict[str, Any]) -> None:
-    """
-    Display the summary metrics in a structured card layout.
-    
-    Args:
-        metrics: Dictionary containing calculated metrics
-    """
-    # Define card styles
-    st.markdown("""
+# Translation table turning "," thousands separators into spaces in one pass
+SPACE_THOUSANDS = str.maketrans(',', ' ')
+
+# Metric keys shown in the KPI panel, in the order of the formatting cache key
+KPI_METRIC_KEYS = (
+    "first_time_record", "last_time_record", "years_between", "total_entries",
+    "unique_people", "unique_projects", "total_hours", "total_billable_hours",
+    "billability_percentage", "total_revenue", "total_cost", "total_profit",
+    "Billable rate", "Effective rate", "avg_revenue_per_project", "profit_margin_percentage"
+)
+
+# Card styles of the KPI panel
+KPI_CSS = """
         <style>
         .metric-card {
             background-color: #f8f9fa;
@@ -54,153 +58,133 @@ def display_summary_metrics(metrics: Dict[str, Any]) -> None:
             font-size: 0.9em;
             color: #666;
         }
+        .kpi-grid {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            column-gap: 1rem;
+        }
+        .kpi-grid .full-width {
+            grid-column: 1 / -1;
+        }
         </style>
-    """, unsafe_allow_html=True)
-    
-    # Format dates and basic metrics
-    first_date = metrics['first_time_record'].strftime("%d.%m.%Y") if metrics.get('first_time_record') else "N/A"
-    last_date = metrics['last_time_record'].strftime("%d.%m.%Y") if metrics.get('last_time_record') else "N/A"
-    years_between = f"{metrics.get('years_between', 0):.1f}"
-    total_entries = f"{metrics.get('total_entries', 0):,}".replace(',', ' ')
-    
-    # Row 1: Context (2 columns)
-    col1, col2 = st.columns(2)
-    
-    # Overview card
-    with col1:
-        html_content = f"""
-        <div class="metric-card">
-            <div class="card-title">📊 Overview</div>
-            <div class="metric-row">
-                <div class="metric-column">
-                    <div class="metric-value">{first_date}</div>
-                    <div class="metric-label">First record</div>
-                </div>
-                <div class="metric-column">
-                    <div class="metric-value">{last_date}</div>
-                    <div class="metric-label">Last record</div>
-                </div>
-                <div class="metric-column">
-                    <div class="metric-value">{years_between}</div>
-                    <div class="metric-label">Years</div>
-                </div>
-            </div>
-        </div>
-        """
-        st.markdown(html_content, unsafe_allow_html=True)
+    """
+
+# Card and column markup of the KPI panel, filled in from KPI_CARDS
+KPI_CARD_TEMPLATE = (
+    '<div class="{card_class}"><div class="card-title">{title}</div>'
+    '<div class="metric-row">{columns}</div></div>'
+)
+KPI_COLUMN_TEMPLATE = (
+    '<div class="metric-column"><div class="metric-value">{value}</div>'
+    '<div class="metric-label">{label}</div></div>'
+)
+
+# KPI panel cards in grid order: (card class, title, ((formatted value key, label), ...))
+# Rows 1-2 hold two cards each; the Performance card spans the full width
+KPI_CARDS = (
+    ("metric-card", "📊 Overview", (
+        ("first_date", "First record"),
+        ("last_date", "Last record"),
+        ("years_between", "Years"),
+    )),
+    ("metric-card", "👥 Scope", (
+        ("unique_people", "Coworkers"),
+        ("unique_projects", "Projects"),
+        ("total_entries", "Time records"),
+    )),
+    ("metric-card", "⏱️ Hours", (
+        ("total_hours", "Hours worked"),
+        ("billable_hours", "Hours billable"),
+        ("billability_percentage", "Billability"),
+    )),
+    ("metric-card", "💰 Income", (
+        ("total_revenue", "Fees"),
+        ("total_cost", "Cost"),
+        ("total_profit", "Profit"),
+    )),
+    ("metric-card full-width", "📈 Performance", (
+        ("billable_hourly_rate", "Billable rate"),
+        ("effective_hourly_rate", "Effective rate"),
+        ("avg_revenue_per_project", "Avg revenue per project"),
+        ("profit_margin", "Profit margin"),
+    )),
+)
+
+
+@st.cache_data(show_spinner=False)
+def cached_kpi_strings(metrics_fingerprint: Tuple[Any, ...], currency: Optional[str]) -> Dict[str, str]:
+    """
+    Formats the KPI panel values, cached across reruns.
     
-    # Scope card
-    with col2:
-        html_content = f"""
-        <div class="metric-card">
-            <div class="card-title">👥 Scope</div>
-            <div class="metric-row">
-                <div class="metric-column">
-                    <div class="metric-value">{metrics.get('unique_people', 0)}</div>
-                    <div class="metric-label">Coworkers</div>
-                </div>
-                <div class="metric-column">
-                    <div class="metric-value">{metrics.get('unique_projects', 0)}</div>
-                    <div class="metric-label">Projects</div>
-                </div>
-                <div class="metric-column">
-                    <div class="metric-value">{total_entries}</div>
-                    <div class="metric-label">Time records</div>
-                </div>
-            </div>
-        </div>
-        """
-        st.markdown(html_content, unsafe_allow_html=True)
+    Args:
+        metrics_fingerprint: Metric values in KPI_METRIC_KEYS order, used as the cache key
+        currency: Current currency code (part of the cache key; the formatters read it)
+        
+    Returns:
+        Dictionary of formatted display strings
+    """
+    metrics = dict(zip(KPI_METRIC_KEYS, metrics_fingerprint))
     
-    # Row 2: Core Business (2 columns)
-    col3, col4 = st.columns(2)
+    # Format dates and basic metrics
+    kpi = {
+        "first_date": metrics['first_time_record'].strftime("%d.%m.%Y") if metrics['first_time_record'] else "N/A",
+        "last_date": metrics['last_time_record'].strftime("%d.%m.%Y") if metrics['last_time_record'] else "N/A",
+        "years_between": f"{metrics['years_between']:.1f}",
+        "total_entries": format(int(metrics['total_entries']), ',d').translate(SPACE_THOUSANDS),
+        "unique_people": f"{metrics['unique_people']}",
+        "unique_projects": f"{metrics['unique_projects']}"
+    }
     
-    # Hours card
-    with col3:
-        total_hours = f"{int(metrics.get('total_hours', 0)):,}".replace(',', ' ')
-        billable_hours = f"{int(metrics.get('total_billable_hours', 0)):,}".replace(',', ' ')
-        billability_percentage = f"{metrics.get('billability_percentage', 0):.1f}%"
-        
-        html_content = f"""
-        <div class="metric-card">
-            <div class="card-title">⏱️ Hours</div>
-            <div class="metric-row">
-                <div class="metric-column">
-                    <div class="metric-value">{total_hours}</div>
-                    <div class="metric-label">Hours worked</div>
-                </div>
-                <div class="metric-column">
-                    <div class="metric-value">{billable_hours}</div>
-                    <div class="metric-label">Hours billable</div>
-                </div>
-                <div class="metric-column">
-                    <div class="metric-value">{billability_percentage}</div>
-                    <div class="metric-label">Billability</div>
-                </div>
-            </div>
-        </div>
-        """
-        st.markdown(html_content, unsafe_allow_html=True)
+    # Hours
+    kpi["total_hours"] = format(int(metrics['total_hours']), ',d').translate(SPACE_THOUSANDS)
+    kpi["billable_hours"] = format(int(metrics['total_billable_hours']), ',d').translate(SPACE_THOUSANDS)
+    kpi["billability_percentage"] = f"{metrics['billability_percentage']:.1f}%"
     
-    # Financial Results card
-    with col4:
-        total_revenue = format_millions(metrics.get('total_revenue', 0))
-        total_cost = format_millions(metrics.get('total_cost', 0))
-        total_profit = format_millions(metrics.get('total_profit', 0))
-        
-        html_content = f"""
-        <div class="metric-card">
-            <div class="card-title">💰 Income</div>
-            <div class="metric-row">
-                <div class="metric-column">
-                    <div class="metric-value">{total_revenue}</div>
-                    <div class="metric-label">Fees</div>
-                </div>
-                <div class="metric-column">
-                    <div class="metric-value">{total_cost}</div>
-                    <div class="metric-label">Cost</div>
-                </div>
-                <div class="metric-column">
-                    <div class="metric-value">{total_profit}</div>
-                    <div class="metric-label">Profit</div>
-                </div>
-            </div>
-        </div>
-        """
-        st.markdown(html_content, unsafe_allow_html=True)
+    # Financial results
+    kpi["total_revenue"] = format_millions(metrics['total_revenue'])
+    kpi["total_cost"] = format_millions(metrics['total_cost'])
+    kpi["total_profit"] = format_millions(metrics['total_profit'])
     
-    # Row 3: Performance (full width)
-    billable_hourly_rate = format_currency(metrics.get('Billable rate', 0)) + "/hr"
-    effective_hourly_rate = format_currency(metrics.get('Effective rate', 0)) + "/hr"
-    avg_revenue_per_project = format_millions(metrics.get('avg_revenue_per_project', 0))
+    # Performance
+    kpi["billable_hourly_rate"] = format_currency(metrics['Billable rate']) + "/hr"
+    kpi["effective_hourly_rate"] = format_currency(metrics['Effective rate']) + "/hr"
+    kpi["avg_revenue_per_project"] = format_millions(metrics['avg_revenue_per_project'])
     
     # Handle profit margin with N/A when revenue = 0
-    if metrics.get('total_revenue', 0) > 0:
-        profit_margin = f"{metrics.get('profit_margin_percentage', 0):.1f}%"
+    if metrics['total_revenue'] > 0:
+        kpi["profit_margin"] = f"{metrics['profit_margin_percentage']:.1f}%"
     else:
-        profit_margin = "N/A"
+        kpi["profit_margin"] = "N/A"
+    
+    return kpi
+
+
+def display_summary_metrics(metrics: Dict[str, Any]) -> None:
+    """
+    Display the summary metrics in a structured card layout.
     
-    html_content = f"""
-    <div class="metric-card">
-        <div class="card-title">📈 Performance</div>
-        <div class="metric-row">
-            <div class="metric-column">
-                <div class="metric-value">{billable_hourly_rate}</div>
-                <div class="metric-label">Billable rate</div>
-            </div>
-            <div class="metric-column">
-                <div class="metric-value">{effective_hourly_rate}</div>
-                <div class="metric-label">Effective rate</div>
-            </div>
-            <div class="metric-column">
-                <div class="metric-value">{avg_revenue_per_project}</div>
-                <div class="metric-label">Avg revenue per project</div>
-            </div>
-            <div class="metric-column">
-                <div class="metric-value">{profit_margin}</div>
-                <div class="metric-label">Profit margin</div>
-            </div>
-        </div>
-    </div>
+    Args:
+        metrics: Dictionary containing calculated metrics
     """
-    st.markdown(html_content, unsafe_allow_html=True)
\ No newline at end of file
+    # Format all values once per distinct set of metrics and currency
+    metrics_fingerprint = tuple(metrics.get(key, 0) for key in KPI_METRIC_KEYS)
+    kpi = cached_kpi_strings(metrics_fingerprint, get_currency_code())
+    
+    # The whole panel is one HTML string: the card styles (built once at import)
+    # followed by a CSS grid of the cards, sent in a single element
+    cards_html = "".join(
+        KPI_CARD_TEMPLATE.format(
+            card_class=card_class,
+            title=title,
+            columns="".join(
+                KPI_COLUMN_TEMPLATE.format(value=kpi[key], label=label)
+                for key, label in columns
+            )
+        )
+        for card_class, title, columns in KPI_CARDS
+    )
+    html_parts = [KPI_CSS, '<div class="kpi-grid">', cards_html, '</div>']
+    
+    # Drop line breaks and indentation so the panel stays one markdown HTML block
+    kpi_html = "".join(line.strip() for line in "".join(html_parts).splitlines())
+    st.markdown(kpi_html, unsafe_allow_html=True)
\ No newline at end of file
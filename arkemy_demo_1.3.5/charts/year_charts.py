@@ -1,11 +1,132 @@
 # year_charts.py
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from utils.chart_helpers import create_standardized_customdata
 
-def render_year_tab(filtered_df, aggregate_by_year, render_chart, get_category_colors):
+# Metrics selectable in the year chart
+YEAR_METRICS = (
+    "Hours worked",
+    "Billable hours",
+    "Billability %",
+    "Billable rate",
+    "Effective rate",
+    "Revenue",
+    "Total cost",
+    "Total profit",
+    "Profit margin %",
+    "Number of projects",
+    "Number of customers",
+    "Number of people"
+)
+
+# Metrics selectable in the monthly trends chart
+MONTH_METRICS = YEAR_METRICS[:-1]
+
+# Calendar order of the month name labels
+MONTH_ORDER = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Distinct line colors of the monthly trend years, cycled for more years
+DISTINCT_COLORS = (
+    '#1f77b4',  # Blue
+    '#ff7f0e',  # Orange
+    '#2ca02c',  # Green
+    '#d62728',  # Red
+    '#9467bd',  # Purple
+    '#8c564b',  # Brown
+    '#e377c2',  # Pink
+    '#7f7f7f',  # Gray
+    '#bcbd22',  # Olive
+    '#17becf',  # Teal
+    '#ff9896',  # Light red
+    '#98df8a',  # Light green
+    '#c5b0d5',  # Light purple
+    '#c49c94',  # Light brown
+    '#f7b6d2',  # Light pink
+    '#dbdb8d',  # Light olive
+    '#9edae5',  # Light teal
+    '#ad494a',  # Dark red
+    '#5254a3',  # Indigo
+    '#f98400'   # Dark orange
+)
+
+# Year chart color scale by metric: red for cost, red-to-green for metrics that can
+# be negative, green (the default) for the rest
+COLOR_SCALE_BY_METRIC = {
+    "Total cost": "Reds",
+    "Total profit": "RdYlGn",
+    "Profit margin %": "RdYlGn"
+}
+
+# Hover value formats of the monthly trend lines (metrics not listed use "%{y:,.0f}")
+MONTHLY_HOVER_FORMATS = {
+    "Hours worked": "%{y:,.0f} hrs",
+    "Billable hours": "%{y:,.0f} hrs",
+    "Billability %": "%{y:,.1f}%",
+    "Profit margin %": "%{y:,.1f}%"
+}
+
+# Unit suffix of the currency metrics in the monthly trend hover, placed after the symbol
+CURRENCY_HOVER_SUFFIXES = {
+    "Billable rate": "/hr",
+    "Effective rate": "/hr",
+    "Revenue": "",
+    "Total cost": "",
+    "Total profit": ""
+}
+
+
+@st.cache_data(show_spinner=False)
+def cached_year_customdata(data_key, _sorted_years):
+    """
+    Builds the year chart's standardized custom data, one row per bar.
+    
+    The rows and their order do not depend on the selected metric, so metric
+    changes reuse the same array.
+    
+    Args:
+        data_key: Dashboard data key identifying the filtered data _sorted_years was built from
+        _sorted_years: Year aggregate sorted by year (not hashed by Streamlit)
+        
+    Returns:
+        NumPy array of shape (years, metrics)
+    """
+    return create_standardized_customdata(_sorted_years).T
+
+
+@st.cache_data(show_spinner=False)
+def cached_monthly_pivot(data_key, _month_year_agg, metric):
+    """
+    Pivots the month-year aggregate into a month by year table with an average row.
+    
+    Args:
+        data_key: Dashboard data key identifying the filtered data _month_year_agg was built from
+        _month_year_agg: Month-year aggregate (not hashed by Streamlit)
+        metric: Metric shown in the table
+        
+    Returns:
+        DataFrame indexed by month name (plus "Average") with one column per year
+    """
+    display_pivot = _month_year_agg.pivot_table(
+        index='Month name',
+        columns='Year',
+        values=metric,
+        aggfunc='sum',
+        observed=True
+    )
+    
+    # Sort months in correct order
+    display_pivot = display_pivot.reindex(list(MONTH_ORDER))
+    
+    # Add average row to the pivot table
+    avg_row = display_pivot.mean().round(0).astype(int)
+    display_pivot.loc['Average'] = avg_row
+    
+    return display_pivot
+
+
+def render_year_tab(filtered_df, aggregate_by_year, render_chart, get_category_colors, data_key):
     """
     Renders the year analysis tab with visualizations and metrics.
     
@@ -14,36 +135,21 @@ def render_year_tab(filtered_df, aggregate_by_year, render_chart, get_category_c
         aggregate_by_year: Function to aggregate data by year
         render_chart: Function to render charts with consistent styling
         get_category_colors: Function to get consistent color schemes
+        data_key: Tuple of (source data fingerprint, frozen filter settings) identifying filtered_df
     """
     #st.subheader("Year Analysis")
     
-    # Add metric selection dropdown
-    metric_options = [
-        "Hours worked",
-        "Billable hours", 
-        "Billability %",
-        "Billable rate",
-        "Effective rate",
-        "Revenue",
-        "Total cost",
-        "Total profit",
-        "Profit margin %",
-        "Number of projects",
-        "Number of customers",
-        "Number of people"
-    ]
-    
     # Get navigation counter to force widget recreation on navigation changes
     nav_counter = st.session_state.get('period_nav_counter', 0)
     
     selected_metric = st.selectbox(
         "Select metric to visualize:",
-        options=metric_options,
+        options=YEAR_METRICS,
         index=0,  # Default to Hours worked
         key=f"year_metric_selector_{nav_counter}"
     )
     
-    # Aggregate by year
+    # Aggregate by year (aggregate_by_year is cached on data_key by the dashboard)
     year_agg = aggregate_by_year(filtered_df)
     
     # Sort years chronologically
@@ -51,31 +157,37 @@ def render_year_tab(filtered_df, aggregate_by_year, render_chart, get_category_c
     
     # Create the bar chart with color gradient and standardized custom data
     # Use red gradient for cost, red-to-green for profit metrics (to show negative as red), green for others
-    if selected_metric == "Total cost":
-        color_scale = "Reds"
-    elif selected_metric in ["Total profit", "Profit margin %"]:
-        color_scale = "RdYlGn"  # Red-Yellow-Green scale (red for negative, green for positive)
-    else:
-        color_scale = "Greens"
-    
-    fig_bar = px.bar(
-        sorted_years,
-        x="Year",
-        y=selected_metric,
-        color=selected_metric,
-        color_continuous_scale=color_scale,
-        title=f"{selected_metric} by Year",
-        custom_data=create_standardized_customdata(sorted_years)
-    )
+    color_scale = COLOR_SCALE_BY_METRIC.get(selected_metric, "Greens")
+    
+    # Hand Plotly contiguous NumPy arrays rather than DataFrame columns
+    years_arr = sorted_years["Year"].to_numpy()
+    vals_arr = sorted_years[selected_metric].to_numpy()
+    
+    # Build the bar trace directly (skips plotly.express' DataFrame processing);
+    # custom data is cached per filtered data and shared by every metric
+    fig_bar = go.Figure(go.Bar(
+        x=years_arr,
+        y=vals_arr,
+        marker=dict(color=vals_arr, coloraxis="coloraxis"),
+        customdata=cached_year_customdata(data_key, sorted_years),
+        showlegend=False
+    ))
 
     # Improve layout for better readability
     fig_bar.update_layout(
+        title=f"{selected_metric} by Year",
+        coloraxis=dict(
+            colorscale=color_scale,
+            autocolorscale=False,
+            colorbar=dict(title=dict(text=selected_metric))
+        ),
+        barmode="relative",
         xaxis_title="",
         yaxis_title=selected_metric,
         xaxis={
             'categoryorder':'total ascending',  # Ensure years are in ascending order
             'tickmode': 'array',
-            'tickvals': sorted_years['Year'],  # Ensure all years are shown
+            'tickvals': years_arr,  # Ensure all years are shown
             'tickangle': 0
         }
     )
@@ -127,7 +239,7 @@ def render_year_tab(filtered_df, aggregate_by_year, render_chart, get_category_c
     )
 
 
-def render_monthly_trends_chart(filtered_df, aggregate_by_month_year, render_chart, get_category_colors):
+def render_monthly_trends_chart(filtered_df, aggregate_by_month_year, render_chart, get_category_colors, data_key):
     """
     Renders a line chart showing monthly trends with each year as a separate line.
     
@@ -136,30 +248,16 @@ def render_monthly_trends_chart(filtered_df, aggregate_by_month_year, render_cha
         aggregate_by_month_year: Function to aggregate data by month and year
         render_chart: Function to render charts with consistent styling
         get_category_colors: Function to get consistent color schemes
+        data_key: Tuple of (source data fingerprint, frozen filter settings) identifying filtered_df
     """
     #st.subheader("Monthly Trends Across Years")
     
-    # Add metric selection dropdown
-    metric_options = [
-        "Hours worked",
-        "Billable hours", 
-        "Billability %",
-        "Billable rate",
-        "Effective rate",
-        "Revenue",
-        "Total cost",
-        "Total profit",
-        "Profit margin %",
-        "Number of projects",
-        "Number of customers"
-    ]
-    
     # Get navigation counter to force widget recreation on navigation changes
     nav_counter = st.session_state.get('period_nav_counter', 0)
     
     selected_metric = st.selectbox(
         "Select metric to visualize:",
-        options=metric_options,
+        options=MONTH_METRICS,
         index=0,  # Default to Hours worked
         key=f"monthly_trend_metric_selector_{nav_counter}"
     )
@@ -168,101 +266,62 @@ def render_monthly_trends_chart(filtered_df, aggregate_by_month_year, render_cha
     from utils.chart_styles import get_currency_formatting
     symbol, position, _ = get_currency_formatting()
     
-    # Aggregate data by month and year
-    month_year_agg = aggregate_by_month_year(filtered_df)
+    # Aggregate data by month and year, sorted for consistent display
+    # (aggregate_by_month_year is cached on data_key by the dashboard)
+    month_year_agg = aggregate_by_month_year(filtered_df).sort_values(["Year", "Month"])
     
-    # Sort by month and year for consistent display
-    month_year_agg = month_year_agg.sort_values(["Year", "Month"])
-    
-    # Extract the list of unique years from the data
-    years = month_year_agg['Year'].unique()
+    # Calendar-ordered categories let groupby return months in order without a reindex
+    month_year_agg['Month name'] = pd.Categorical(
+        month_year_agg['Month name'], categories=MONTH_ORDER, ordered=True
+    )
     
     # Create a new figure object
     fig = go.Figure()
     
-    # Define correct month order
-    month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    # Calculate monthly averages across all years and reindex to correct month order
-    monthly_avg = month_year_agg.groupby('Month name')[selected_metric].mean()
-    monthly_avg = monthly_avg.reindex(month_order)
-    
-    # Define a list of distinct colors for better differentiation
-    distinct_colors = [
-        '#1f77b4',  # Blue
-        '#ff7f0e',  # Orange
-        '#2ca02c',  # Green
-        '#d62728',  # Red
-        '#9467bd',  # Purple
-        '#8c564b',  # Brown
-        '#e377c2',  # Pink
-        '#7f7f7f',  # Gray
-        '#bcbd22',  # Olive
-        '#17becf',  # Teal
-        '#ff9896',  # Light red
-        '#98df8a',  # Light green
-        '#c5b0d5',  # Light purple
-        '#c49c94',  # Light brown
-        '#f7b6d2',  # Light pink
-        '#dbdb8d',  # Light olive
-        '#9edae5',  # Light teal
-        '#ad494a',  # Dark red
-        '#5254a3',  # Indigo
-        '#f98400'   # Dark orange
-    ]
-    
-    # Create formatted hover templates based on metric type
-    def create_metric_hover_template(is_average=False):
-        prefix = "<b>Average Across All Years</b><br>" if is_average else "<b>Year: %{fullData.name}</b><br>"
-        base_template = prefix + "<b>Month: %{x}</b><br>" + f"{selected_metric}: "
-        
-        if "hours" in selected_metric.lower():
-            value_format = "%{y:,.0f} hrs"
-        elif "billability" in selected_metric.lower() or "margin" in selected_metric.lower():
-            value_format = "%{y:,.1f}%"
-        elif "rate" in selected_metric.lower():
-            if position == 'before':
-                value_format = f"{symbol}%{{y:,.0f}}/hr"
-            else:
-                value_format = f"%{{y:,.0f}} {symbol}/hr"
-        elif "revenue" in selected_metric.lower() or "cost" in selected_metric.lower() or "profit" in selected_metric.lower():
-            if position == 'before':
-                value_format = f"{symbol}%{{y:,.0f}}"
-            else:
-                value_format = f"%{{y:,.0f}} {symbol}"
+    # Calculate monthly averages across all years, already in calendar order
+    # (unobserved months are kept as NaN so the average line shows the gap)
+    monthly_avg = month_year_agg.groupby('Month name', observed=False, sort=True)[selected_metric].mean()
+    
+    # Build the hover templates once for the selected metric
+    if selected_metric in CURRENCY_HOVER_SUFFIXES:
+        suffix = CURRENCY_HOVER_SUFFIXES[selected_metric]
+        if position == 'before':
+            value_format = f"{symbol}%{{y:,.0f}}{suffix}"
         else:
-            value_format = "%{y:,.0f}"
-            
-        return base_template + value_format
+            value_format = f"%{{y:,.0f}} {symbol}{suffix}"
+    else:
+        value_format = MONTHLY_HOVER_FORMATS.get(selected_metric, "%{y:,.0f}")
+    
+    value_line = "<b>Month: %{x}</b><br>" + f"{selected_metric}: " + value_format + "<extra></extra>"
+    template_year = "<b>Year: %{fullData.name}</b><br>" + value_line
+    template_avg = "<b>Average Across All Years</b><br>" + value_line
     
     # Add each year's trace to the figure with distinct colors
-    for i, year in enumerate(years):
+    # (one groupby pass; rows are already sorted by month within each year)
+    for i, (year, year_data) in enumerate(month_year_agg.groupby('Year', sort=True)):
         # Use modulo to cycle through colors if more years than colors
-        color_idx = i % len(distinct_colors)
-        color = distinct_colors[color_idx]
-        
-        year_data = month_year_agg[month_year_agg['Year'] == year].sort_values('Month')
+        color_idx = i % len(DISTINCT_COLORS)
+        color = DISTINCT_COLORS[color_idx]
         
         fig.add_trace(go.Scatter(
-            x=year_data['Month name'],
-            y=year_data[selected_metric],
+            x=year_data['Month name'].to_numpy(),
+            y=year_data[selected_metric].to_numpy(),
             name=str(int(year)),
             mode='lines+markers',
             line=dict(color=color, width=2),
             marker=dict(size=8),
-            hovertemplate=create_metric_hover_template() + "<extra></extra>"
+            hovertemplate=template_year
         ))
     
     # Add the average line after all year lines (so it appears first in legend)
     fig.add_trace(go.Scatter(
-        x=monthly_avg.index.tolist(),
-        y=monthly_avg.values.tolist(),
+        x=monthly_avg.index.to_numpy(),
+        y=monthly_avg.to_numpy(),
         name="AVG - All Years",
         mode='lines+markers',
         line=dict(color='black', width=3, dash='dash'),
         marker=dict(size=10, symbol='star'),
-        hovertemplate=create_metric_hover_template(is_average=True) + "<extra></extra>"
+        hovertemplate=template_avg
     ))
     
     # Update layout
@@ -273,8 +332,7 @@ def render_monthly_trends_chart(filtered_df, aggregate_by_month_year, render_cha
         legend_title="Year",
         xaxis=dict(
             categoryorder='array',
-            categoryarray=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+            categoryarray=list(MONTH_ORDER)
         ),
         # Move legend to right side and adjust order
         legend=dict(
@@ -291,32 +349,10 @@ def render_monthly_trends_chart(filtered_df, aggregate_by_month_year, render_cha
     
     # Show a table with the data
     with st.expander("View Monthly Data Table"):
-        # Create a pivot table for display
-        display_pivot = month_year_agg.pivot_table(
-            index='Month name',
-            columns='Year',
-            values=selected_metric,
-            aggfunc='sum'
-        )
-        
-        # Sort months in correct order
-        month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        display_pivot = display_pivot.reindex(month_order)
-        
-        # Add average row to the pivot table
-        avg_row = display_pivot.mean().round(0).astype(int)
-        display_pivot.loc['Average'] = avg_row
+        # Create a pivot table for display (cached; the expander body runs even when collapsed)
+        display_pivot = cached_monthly_pivot(data_key, month_year_agg, selected_metric)
         
         # Display the table
-        from utils.chart_styles import create_column_config
-        
-        # Create a temporary DataFrame with the right structure for column config
-        temp_df = pd.DataFrame()
-        for year in display_pivot.columns:
-            temp_df[str(int(year))] = display_pivot[year]
-            
-        # Display the table with formatting based on metric type
         st.dataframe(
             display_pivot, 
             use_container_width=True
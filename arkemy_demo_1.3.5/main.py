@@ -1,13 +1,8 @@
 # main.py
 import streamlit as st
 import os
-import glob
 import gc
 
-# Import UI functions
-from ui import render_dashboard
-from ui.parquet_processor import process_parquet_data_from_path
-
 # Set page configuration
 st.set_page_config(
     page_title="Arkemy v1.3: Turning Your Project Data Into Gold 🥇",
@@ -16,46 +11,47 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 #sss
-# Initialize session state
-if 'csv_loaded' not in st.session_state:
-    st.session_state.csv_loaded = False
-if 'transformed_df' not in st.session_state:
-    st.session_state.transformed_df = None
-if 'currency' not in st.session_state:
-    st.session_state.currency = 'nok'  # Default to Norwegian krone
-if 'currency_selected' not in st.session_state:
-    st.session_state.currency_selected = False
-if 'planned_csv_loaded' not in st.session_state:
-    st.session_state.planned_csv_loaded = False
-if 'transformed_planned_df' not in st.session_state:
-    st.session_state.transformed_planned_df = None
-if 'active_tab' not in st.session_state:
-    st.session_state.active_tab = 0
-if 'data_loading_attempted' not in st.session_state:
-    st.session_state.data_loading_attempted = False
-if 'show_uploader' not in st.session_state:
-    st.session_state.show_uploader = False
+# Session state defaults, set once per session
+SESSION_STATE_DEFAULTS = (
+    ('csv_loaded', False),
+    ('transformed_df', None),
+    ('currency', 'nok'),  # Default to Norwegian krone
+    ('currency_selected', False),
+    ('planned_csv_loaded', False),
+    ('transformed_planned_df', None),
+    ('active_tab', 0),
+    ('data_loading_attempted', False),
+    ('show_uploader', False),
+    # Capacity-related session state variables
+    ('schedule_loaded', False),
+    ('schedule_df', None),
+    ('absence_loaded', False),
+    ('absence_df', None),
+    ('capacity_config', None),
+    ('capacity_summary_loaded', False),
+    ('capacity_summary_df', None)
+)
 
-# Initialize capacity-related session state variables
-if 'schedule_loaded' not in st.session_state:
-    st.session_state.schedule_loaded = False
-if 'schedule_df' not in st.session_state:
-    st.session_state.schedule_df = None
-if 'absence_loaded' not in st.session_state:
-    st.session_state.absence_loaded = False
-if 'absence_df' not in st.session_state:
-    st.session_state.absence_df = None
-if 'capacity_config' not in st.session_state:
-    st.session_state.capacity_config = None
-if 'capacity_summary_loaded' not in st.session_state:
-    st.session_state.capacity_summary_loaded = False
-if 'capacity_summary_df' not in st.session_state:
-    st.session_state.capacity_summary_df = None
+# Initialize session state
+session_state = st.session_state
+for key, default in SESSION_STATE_DEFAULTS:
+    if key not in session_state:
+        session_state[key] = default
 
 def find_parquet_file():
-    """Find the first Parquet file in project root"""
-    parquet_files = glob.glob("*.parquet") + glob.glob("*.pq")
-    return parquet_files[0] if parquet_files else None
+    """Find the first Parquet file in project root (.parquet preferred over .pq)"""
+    first_pq = None
+    # Single directory pass; stops at the first .parquet file
+    with os.scandir(".") as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(".") or not entry.is_file():
+                continue
+            if name.endswith(".parquet"):
+                return name
+            if first_pq is None and name.endswith(".pq"):
+                first_pq = name
+    return first_pq
 
 def is_data_loaded():
     """Check if data is loaded and available for analysis"""
@@ -101,6 +97,7 @@ def auto_load_data():
         return
     
     # Process the parquet file (suppress output with empty container)
+    from ui.parquet_processor import process_parquet_data_from_path
     with st.empty():
         try:
             process_parquet_data_from_path(parquet_path)
@@ -124,24 +121,29 @@ def render_currency_setup():
         st.session_state.currency_selected = True
         st.rerun()
 
+def frame_shape(key):
+    """Shape of the DataFrame stored under key in session state, or None if it is not loaded"""
+    df = st.session_state.get(key)
+    return df.shape if df is not None else None
+
 def show_data_status():
-    """Show data loading status for debugging"""
+    """Show data loading status for debugging (only wired in when ARKEMY_DEBUG is set)"""
     if st.sidebar.expander("Debug: Data Status"):
         st.sidebar.write("**Main Data:**")
         st.sidebar.write(f"- CSV loaded: {st.session_state.csv_loaded}")
-        st.sidebar.write(f"- Main DF shape: {getattr(st.session_state.transformed_df, 'shape', 'None')}")
+        st.sidebar.write(f"- Main DF shape: {frame_shape('transformed_df')}")
         
         st.sidebar.write("**Planned Data:**")
         st.sidebar.write(f"- Planned loaded: {st.session_state.planned_csv_loaded}")
-        st.sidebar.write(f"- Planned DF shape: {getattr(st.session_state.transformed_planned_df, 'shape', 'None')}")
+        st.sidebar.write(f"- Planned DF shape: {frame_shape('transformed_planned_df')}")
         
         st.sidebar.write("**Capacity Data:**")
         st.sidebar.write(f"- Schedule loaded: {st.session_state.schedule_loaded}")
-        st.sidebar.write(f"- Schedule DF shape: {getattr(st.session_state.schedule_df, 'shape', 'None')}")
+        st.sidebar.write(f"- Schedule DF shape: {frame_shape('schedule_df')}")
         st.sidebar.write(f"- Absence loaded: {st.session_state.absence_loaded}")
-        st.sidebar.write(f"- Absence DF shape: {getattr(st.session_state.absence_df, 'shape', 'None')}")
+        st.sidebar.write(f"- Absence DF shape: {frame_shape('absence_df')}")
         st.sidebar.write(f"- Capacity summary loaded: {st.session_state.capacity_summary_loaded}")
-        st.sidebar.write(f"- Capacity summary DF shape: {getattr(st.session_state.capacity_summary_df, 'shape', 'None')}")
+        st.sidebar.write(f"- Capacity summary DF shape: {frame_shape('capacity_summary_df')}")
         st.sidebar.write(f"- Config available: {st.session_state.capacity_config is not None}")
 
     if st.sidebar.button("View Capacity Data"):
@@ -167,5 +169,10 @@ if __name__ == "__main__":
             # Show loading screen while attempting to load
             show_loading_screen()
     else:
-        # Render the dashboard with data
+        # Render the dashboard with data (the chart modules are only imported here)
+        from ui import render_dashboard
         render_dashboard()
+        
+        # Debug panel stays out of the normal rerun path
+        if os.environ.get("ARKEMY_DEBUG"):
+            show_data_status()
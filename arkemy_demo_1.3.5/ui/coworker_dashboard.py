@@ -1,6 +1,7 @@
 # ui/coworker_dashboard.py
 import streamlit as st
 import pandas as pd
+import numpy as np
 from typing import Dict, Any, Optional, Tuple
 
 from processors.coworker_processor import (
@@ -18,6 +19,161 @@ from charts.coworker_charts import (
     render_coworker_details_section,
     render_coworker_data_section
 )
+from utils.chart_helpers import dataframe_fingerprint, to_arrow_table
+from ui.dashboard import freeze_filter_settings
+
+# Columns the coworker analysis cannot run without
+REQUIRED_COWORKER_COLUMNS = frozenset({"Date", "Person", "Hours worked", "Billable hours"})
+
+# Data quality warning codes -> (Streamlit element, message); unknown codes are not shown
+QUALITY_WARNING_RENDERERS = {
+    "absence_data_missing": (st.warning, "📅 Absence data not available - using estimates"),
+    "schedule_data_estimated": (st.info, "⏰ Schedule data estimated from working days")
+}
+
+# Chart types offered by the chart type selector, and their positions
+CHART_TYPES = ("Bar chart", "Hours Flow", "Forecast", "Insights")
+CHART_TYPE_INDEX = {chart_type: i for i, chart_type in enumerate(CHART_TYPES)}
+
+# Ranking table columns shown with one decimal
+RANKING_ROUNDED_COLUMNS = ["Capacity/Period", "Project hours", "Billable rate (%)", "Utilization (%)"]
+
+# Chart sections by chart type: (title, description, chart renderer, message when no
+# person is selected - None falls back to the team comparison)
+CHART_SECTIONS = {
+    "Bar chart": (
+        "Performance Comparison",
+        "Compare different performance metrics across time periods.",
+        render_coworker_comparison_chart,
+        None
+    ),
+    "Hours Flow": (
+        "Hours Flow Analysis",
+        "This chart shows how hours flow from scheduled capacity through to billable and non-billable work.",
+        render_coworker_hours_flow_chart,
+        "Please select a person to view hours flow analysis."
+    ),
+    "Forecast": (
+        "Forecast Analysis",
+        "Analyze trends and forecast future performance.",
+        render_coworker_forecast_chart,
+        "Please select a person to view forecast analysis."
+    )
+}
+
+@st.cache_data(show_spinner="Processing coworker data...")
+def cached_coworker_data(df_fingerprint, planned_fingerprint, filter_settings,
+                         _transformed_df, _planned_df):
+    """
+    Runs the coworker processing pipeline, cached across reruns.
+    
+    Args:
+        df_fingerprint: Fingerprint of _transformed_df (from dataframe_fingerprint), used as the cache key
+        planned_fingerprint: Fingerprint of _planned_df, or None when there is no planned data
+        filter_settings: Existing filter settings from main dashboard
+        _transformed_df: Main Arkemy dataframe (not hashed by Streamlit)
+        _planned_df: Optional planned hours dataframe (not hashed by Streamlit)
+        
+    Returns:
+        Tuple of (coworker_df, quality_info, metrics_by_person), where metrics_by_person
+        maps each person (including "All coworkers") to their summary metrics
+    """
+    coworker_df, quality_info = process_coworker_data(_transformed_df, _planned_df, filter_settings)
+    
+    # Categorical persons give the selection list for free and let groupbys use the codes.
+    # Rows are sorted by person (stable, missing persons first) so each person's records
+    # form one contiguous block that can be sliced without a mask.
+    metrics_by_person = {}
+    if "Person" in coworker_df.columns:
+        coworker_df["Person"] = coworker_df["Person"].astype("category")
+        coworker_df = coworker_df.sort_values("Person", kind="stable", na_position="first").reset_index(drop=True)
+        
+        # Summary metrics per person are computed once per dataset, not on every rerun
+        metrics_by_person = {
+            person: calculate_coworker_summary_metrics(person_df)
+            for person, person_df in coworker_df.groupby("Person", sort=False, observed=True)
+        }
+    return coworker_df, quality_info, metrics_by_person
+
+@st.cache_data(show_spinner=False)
+def cached_person_bounds(data_key, _coworker_df):
+    """
+    Maps each person to the row range of their records, cached across reruns.
+    
+    Args:
+        data_key: Coworker data key identifying _coworker_df
+        _coworker_df: Processed coworker dataframe sorted by person (not hashed by Streamlit)
+        
+    Returns:
+        Dict of person -> (start, end) row positions in _coworker_df
+    """
+    persons = _coworker_df["Person"].cat
+    codes = persons.codes.to_numpy()
+    category_codes = np.arange(len(persons.categories))
+    starts = np.searchsorted(codes, category_codes, side="left")
+    ends = np.searchsorted(codes, category_codes, side="right")
+    return {
+        person: (int(start), int(end))
+        for person, start, end in zip(persons.categories, starts, ends)
+    }
+
+@st.cache_data(show_spinner=False)
+def cached_summary_metrics(frame_key, _df):
+    """
+    Calculates coworker summary metrics, cached across reruns.
+    
+    Args:
+        frame_key: Tuple of (coworker data key, person) identifying _df
+        _df: Coworker dataframe to summarize (not hashed by Streamlit)
+        
+    Returns:
+        Dict of summary metrics
+    """
+    return calculate_coworker_summary_metrics(_df)
+
+@st.cache_data(show_spinner=False)
+def cached_performance_ranking(frame_key, metric, _df):
+    """
+    Ranks persons by a performance metric, cached across reruns.
+    
+    Args:
+        frame_key: Tuple of (coworker data key, person) identifying _df
+        metric: Metric to rank by, e.g. "billable_rate"
+        _df: Coworker dataframe to rank (not hashed by Streamlit)
+        
+    Returns:
+        Ranking DataFrame
+    """
+    return get_person_performance_ranking(_df, metric=metric)
+
+@st.cache_data(show_spinner=False)
+def cached_coworker_insights(frame_key, person, _df):
+    """
+    Generates the insights for a person, cached across reruns.
+    
+    Args:
+        frame_key: Tuple of (coworker data key, person) identifying _df
+        person: Person to generate insights for
+        _df: Coworker dataframe for the person (not hashed by Streamlit)
+        
+    Returns:
+        List of insight strings
+    """
+    return generate_coworker_insights(_df, person)
+
+@st.cache_data(show_spinner=False)
+def cached_team_totals(data_key, _coworker_df):
+    """
+    Calculates summary metrics over all individual persons (excluding "All coworkers").
+    
+    Args:
+        data_key: Coworker data key identifying _coworker_df
+        _coworker_df: Processed coworker dataframe (not hashed by Streamlit)
+        
+    Returns:
+        Dict of summary metrics for the whole team
+    """
+    return calculate_coworker_summary_metrics(_coworker_df[_coworker_df["Person"] != "All coworkers"])
 
 def render_coworker_dashboard(transformed_df: pd.DataFrame, 
                              planned_df: Optional[pd.DataFrame] = None,
@@ -35,12 +191,37 @@ def render_coworker_dashboard(transformed_df: pd.DataFrame,
     """
     st.header("📊 Coworker Analysis")
     
-    # Process data
-    with st.spinner("Processing coworker data..."):
-        coworker_df, quality_info = process_coworker_data(
-            transformed_df, 
-            planned_df, 
-            filter_settings
+    # Skip the processing pipeline when the required columns are missing
+    if not should_show_coworker_dashboard(transformed_df):
+        st.warning("No coworker data available. Please check your data source and filters.")
+        show_data_requirements()
+        return
+    
+    # Process data (cached, so reruns with unchanged inputs skip the pipeline).
+    # While the session keeps passing the same frames, the processed result is reused
+    # from session state, so the content fingerprints are only hashed when inputs change.
+    # The source frames themselves are stored and compared with `is`, so a reloaded
+    # frame that happens to reuse an old object id is never mistaken for the old one.
+    frozen_filters = freeze_filter_settings(filter_settings)
+    processed = st.session_state.get("coworker_data")
+    if (processed is not None and processed[0] is transformed_df
+            and processed[1] is planned_df and processed[2] == frozen_filters):
+        _, _, _, data_key, coworker_df, quality_info, metrics_by_person = processed
+    else:
+        df_fingerprint = dataframe_fingerprint(transformed_df)
+        planned_fingerprint = dataframe_fingerprint(planned_df) if planned_df is not None else None
+        coworker_df, quality_info, metrics_by_person = cached_coworker_data(
+            df_fingerprint,
+            planned_fingerprint,
+            filter_settings,
+            transformed_df,
+            planned_df
+        )
+        # One key identifies the processed frame; the render helpers below key their
+        # caches on it (plus the selected person) instead of hashing rows again
+        data_key = (df_fingerprint, planned_fingerprint, frozen_filters)
+        st.session_state["coworker_data"] = (
+            transformed_df, planned_df, frozen_filters, data_key, coworker_df, quality_info, metrics_by_person
         )
     
     
@@ -57,8 +238,9 @@ def render_coworker_dashboard(transformed_df: pd.DataFrame,
     # Future enhancement: integrate with main dashboard filters or add dedicated coworker filters
     
     # Default to showing all data with "All coworkers" selected
-    available_persons = coworker_df["Person"].unique().tolist()
-    default_person = "All coworkers" if "All coworkers" in available_persons else (available_persons[0] if available_persons else None)
+    available_persons = coworker_df["Person"].cat.categories.tolist()
+    person_index = {person: i for i, person in enumerate(available_persons)}
+    default_person = "All coworkers" if "All coworkers" in person_index else (available_persons[0] if available_persons else None)
     
     # Simple person selection without complex filtering for now
     st.subheader("👥 Person Selection")
@@ -68,14 +250,19 @@ def render_coworker_dashboard(transformed_df: pd.DataFrame,
         selected_person = st.selectbox(
             "Select Person",
             available_persons,
-            index=available_persons.index(default_person) if default_person in available_persons else 0
+            index=person_index.get(default_person, 0)
         )
     
     # Apply simple person filter - use all data for the selected person
+    # (the frame is sorted by person, so this is a slice of a cached row range
+    # rather than a mask over the whole frame on every rerun)
     if selected_person:
-        filtered_df = coworker_df[coworker_df["Person"] == selected_person].copy()
+        person_bounds = cached_person_bounds(data_key, coworker_df)
+        start, end = person_bounds.get(selected_person, (0, 0))
+        filtered_df = coworker_df.iloc[start:end]
     else:
-        filtered_df = coworker_df.copy()
+        # The sections below only read the frame, so no defensive copy is needed
+        filtered_df = coworker_df
     
     filter_info = {"person": selected_person}
     
@@ -90,32 +277,41 @@ def render_coworker_dashboard(transformed_df: pd.DataFrame,
     #     st.write(f"Debug: Unique persons in filtered data: {filtered_df['Person'].unique().tolist()}")
     
     # Main dashboard content
-    render_coworker_summary(filtered_df, selected_person)
+    # The summary renders into one placeholder, so person changes replace its
+    # contents in place rather than rebuilding the surrounding layout
+    summary_slot = st.empty()
+    with summary_slot.container():
+        render_coworker_summary(filtered_df, selected_person, data_key, metrics_by_person)
+    render_chart_region(filtered_df, selected_person, coworker_df, data_key)
+
+@st.fragment
+def render_chart_region(filtered_df: pd.DataFrame, selected_person: str, coworker_df: pd.DataFrame,
+                        data_key: Tuple):
+    """
+    Render the chart type selector and the selected chart or insights section.
     
+    Runs as a fragment, so switching chart type (or using a chart's widgets) only
+    reruns this region, not the processing, person selection and summary above.
+    """
     # Initialize chart type selection in session state
     if 'coworker_chart_type' not in st.session_state:
         st.session_state.coworker_chart_type = "Bar chart"
     
     # Chart type selection
-    st.markdown('<div class="nav-tertiary">', unsafe_allow_html=True)
-    chart_type = st.radio(
-        "Chart Type",
-        ["Bar chart", "Hours Flow", "Forecast", "Insights"],
-        index=["Bar chart", "Hours Flow", "Forecast", "Insights"].index(st.session_state.coworker_chart_type),
-        key='coworker_chart_type',
-        horizontal=True
-    )
-    st.markdown('</div>', unsafe_allow_html=True)
+    with st.container(key="coworker_chart_nav"):
+        chart_type = st.radio(
+            "Chart Type",
+            CHART_TYPES,
+            index=CHART_TYPE_INDEX[st.session_state.coworker_chart_type],
+            key='coworker_chart_type',
+            horizontal=True
+        )
     
     # Render content based on selected chart type
-    if chart_type == "Bar chart":
-        render_comparison_section(filtered_df, selected_person)
-    elif chart_type == "Hours Flow":
-        render_hours_flow_section(filtered_df, selected_person)
-    elif chart_type == "Forecast":
-        render_forecast_section(filtered_df, selected_person)
+    if chart_type in CHART_SECTIONS:
+        render_chart_section(filtered_df, selected_person, chart_type, data_key)
     elif chart_type == "Insights":
-        render_insights_section(filtered_df, selected_person, coworker_df)
+        render_insights_section(filtered_df, selected_person, coworker_df, data_key)
 
 def show_data_quality_info(quality_info: Dict[str, Any]):
     """Display data quality information and warnings."""
@@ -131,20 +327,19 @@ def show_data_quality_info(quality_info: Dict[str, Any]):
     if warnings:
         with st.expander("⚠️ Data Quality Warnings", expanded=False):
             for warning in warnings:
-                if warning == "absence_data_missing":
-                    st.warning("📅 Absence data not available - using estimates")
-                elif warning == "schedule_data_estimated":
-                    st.info("⏰ Schedule data estimated from working days")
+                renderer = QUALITY_WARNING_RENDERERS.get(warning)
+                if renderer is not None:
+                    show, message = renderer
+                    show(message)
     
     # Show data completeness
     completeness = quality_info.get("data_completeness", {})
     if completeness:
         with st.expander("📊 Data Completeness", expanded=False):
-            col1, col2, col3 = st.columns(3)
+            cols = st.columns(3)
             
             for i, (field, rate) in enumerate(completeness.items()):
-                col = [col1, col2, col3][i % 3]
-                with col:
+                with cols[i % 3]:
                     st.metric(
                         field.replace("_", " ").title(),
                         f"{rate:.1%}",
@@ -171,13 +366,26 @@ def show_data_requirements():
         - Period-based performance trends
         """)
 
-def render_coworker_summary(df: pd.DataFrame, selected_person: str):
+def render_coworker_summary(df: pd.DataFrame, selected_person: str, data_key: Tuple,
+                            metrics_by_person: Optional[Dict[str, Dict[str, Any]]] = None):
     """Render summary metrics for the selected person/period."""
     if df.empty:
         return
     
-    # Calculate summary metrics
-    metrics = calculate_coworker_summary_metrics(df)
+    # Use the precomputed metrics for the selected person, or calculate them
+    metrics = (metrics_by_person or {}).get(selected_person)
+    if metrics is None:
+        metrics = cached_summary_metrics((data_key, selected_person), df)
+    
+    # Read each metric once
+    total_periods = metrics.get("total_periods", 0)
+    billable_rate = metrics.get("overall_billable_rate", 0)
+    total_capacity = metrics.get("total_capacity", 0)
+    total_billable = metrics.get("total_project_hours", 0)
+    date_range = metrics.get("date_range")
+    
+    # Delta against the 80% billable target (none when there is no rate)
+    billable_delta = f"{billable_rate - 80:.1f}%" if billable_rate != 0 else None
     
     # Display key metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -185,83 +393,42 @@ def render_coworker_summary(df: pd.DataFrame, selected_person: str):
     with col1:
         st.metric(
             "Periods Analyzed",
-            metrics.get("total_periods", 0)
+            total_periods
         )
     
     with col2:
-        billable_rate = metrics.get("overall_billable_rate", 0)
         st.metric(
             "Overall Billable Rate",
             f"{billable_rate}%",
-            delta=f"{billable_rate - 80:.1f}%" if billable_rate != 0 else None,
+            delta=billable_delta,
             delta_color="normal"
         )
     
     with col3:
-        total_capacity = metrics.get("total_capacity", 0)
         st.metric(
             "Total Capacity",
             f"{total_capacity:.0f} hrs"
         )
     
     with col4:
-        total_billable = metrics.get("total_project_hours", 0)
         st.metric(
             "Total Billable",
             f"{total_billable:.0f} hrs"
         )
     
     # Show date range if available
-    if "date_range" in metrics:
-        date_range = metrics["date_range"]
+    if date_range is not None:
         st.caption(f"📅 Period: {date_range['start'].strftime('%b %Y')} - {date_range['end'].strftime('%b %Y')}")
 
-def render_hours_flow_section(df: pd.DataFrame, selected_person: str):
-    """Render the hours flow analysis section."""
-    st.subheader("Hours Flow Analysis")
-    st.write("This chart shows how hours flow from scheduled capacity through to billable and non-billable work.")
-    
-    if selected_person and selected_person != "All coworkers":
-        # Individual analysis
-        person_df = render_coworker_hours_flow_chart(df, selected_person)
-        
-        # Show details
-        render_coworker_details_section(person_df)
-        
-        # Show data table
-        with st.expander("📊 Detailed Data", expanded=False):
-            render_coworker_data_section(person_df)
-    elif selected_person == "All coworkers":
-        # For "All coworkers", show the aggregated flow chart
-        person_df = render_coworker_hours_flow_chart(df, selected_person)
-        
-        # Show details
-        render_coworker_details_section(person_df)
-        
-        # Show data table
-        with st.expander("📊 Detailed Data", expanded=False):
-            render_coworker_data_section(person_df)
-    else:
-        st.info("Please select a person to view hours flow analysis.")
-
-def render_comparison_section(df: pd.DataFrame, selected_person: str):
-    """Render the comparison analysis section."""
-    st.subheader("Performance Comparison")
-    st.write("Compare different performance metrics across time periods.")
-    
-    if selected_person and selected_person != "All coworkers":
-        # Individual comparison analysis
-        person_df = render_coworker_comparison_chart(df, selected_person)
-        
-        # Show details
-        render_coworker_details_section(person_df)
-        
-        # Show data table
-        with st.expander("📊 Detailed Data", expanded=False):
-            render_coworker_data_section(person_df)
-    elif selected_person == "All coworkers":
-        # For "All coworkers", show the team comparison analysis
-        person_df = render_coworker_comparison_chart(df, selected_person)
+def render_chart_section(df: pd.DataFrame, selected_person: str, chart_type: str, data_key: Tuple):
+    """Render a chart section (comparison, hours flow or forecast) from CHART_SECTIONS."""
+    title, description, render_chart, no_person_message = CHART_SECTIONS[chart_type]
+    st.subheader(title)
+    st.write(description)
+    
+    if selected_person:
+        # Individual analysis, or the aggregated team view for "All coworkers"
+        person_df = render_chart(df, selected_person)
         
         # Show details
         render_coworker_details_section(person_df)
@@ -269,16 +436,18 @@ def render_comparison_section(df: pd.DataFrame, selected_person: str):
         # Show data table
         with st.expander("📊 Detailed Data", expanded=False):
             render_coworker_data_section(person_df)
-    else:
+    elif no_person_message is None:
         # Team comparison fallback
-        render_team_comparison(df)
+        render_team_comparison(df, (data_key, selected_person))
+    else:
+        st.info(no_person_message)
 
-def render_team_comparison(df: pd.DataFrame):
+def render_team_comparison(df: pd.DataFrame, frame_key: Tuple):
     """Render team-wide comparison when 'All coworkers' is selected."""
     st.subheader("Team Performance Overview")
     
     # Get ranking of all persons
-    ranking_df = get_person_performance_ranking(df, metric="billable_rate")
+    ranking_df = cached_performance_ranking(frame_key, "billable_rate", df)
     
     if not ranking_df.empty:
         st.subheader("📈 Team Performance Ranking")
@@ -287,57 +456,36 @@ def render_team_comparison(df: pd.DataFrame):
         display_df = ranking_df.copy()
         display_df.index.name = "Rank"
         
-        # Format columns
-        numeric_columns = ["Capacity/Period", "Project hours", "Billable rate (%)", "Utilization (%)"]
-        for col in numeric_columns:
-            if col in display_df.columns:
-                display_df[col] = display_df[col].round(1)
+        # Format columns (one round over the present columns)
+        rounded_columns = display_df.columns.intersection(RANKING_ROUNDED_COLUMNS, sort=False)
+        if len(rounded_columns):
+            display_df[rounded_columns] = display_df[rounded_columns].round(1)
         
-        st.dataframe(display_df, use_container_width=True)
+        # Hand st.dataframe a cached Arrow table; the rank index becomes a column
+        st.dataframe(
+            to_arrow_table(display_df.reset_index()),
+            use_container_width=True,
+            hide_index=True
+        )
         
         # Quick insights
         if len(ranking_df) > 0:
-            top_performer = ranking_df.iloc[0]
-            avg_rate = ranking_df["Billable rate (%)"].mean()
+            # Scalar lookups on the ranked columns instead of materializing the top row
+            billable_rates = ranking_df["Billable rate (%)"]
+            top_person = ranking_df["Person"].iat[0]
+            top_rate = billable_rates.iat[0]
+            avg_rate = np.nanmean(billable_rates.to_numpy(dtype=float))
             
             col1, col2 = st.columns(2)
             with col1:
-                st.metric("Top Performer", top_performer["Person"])
-                st.metric("Top Rate", f"{top_performer['Billable rate (%)']}%")
+                st.metric("Top Performer", top_person)
+                st.metric("Top Rate", f"{top_rate}%")
             
             with col2:
                 st.metric("Team Average", f"{avg_rate:.1f}%")
                 st.metric("Team Members", len(ranking_df))
 
-def render_forecast_section(df: pd.DataFrame, selected_person: str):
-    """Render the forecast analysis section."""
-    st.subheader("Forecast Analysis")
-    st.write("Analyze trends and forecast future performance.")
-    
-    if selected_person and selected_person != "All coworkers":
-        # Individual forecast analysis
-        person_df = render_coworker_forecast_chart(df, selected_person)
-        
-        # Show details
-        render_coworker_details_section(person_df)
-        
-        # Show data table
-        with st.expander("📊 Detailed Data", expanded=False):
-            render_coworker_data_section(person_df)
-    elif selected_person == "All coworkers":
-        # For "All coworkers", show team forecast analysis
-        person_df = render_coworker_forecast_chart(df, selected_person)
-        
-        # Show details
-        render_coworker_details_section(person_df)
-        
-        # Show data table
-        with st.expander("📊 Detailed Data", expanded=False):
-            render_coworker_data_section(person_df)
-    else:
-        st.info("Please select a person to view forecast analysis.")
-
-def render_insights_section(df: pd.DataFrame, selected_person: str, full_df: pd.DataFrame):
+def render_insights_section(df: pd.DataFrame, selected_person: str, full_df: pd.DataFrame, data_key: Tuple):
     """Render the insights and recommendations section."""
     st.subheader("💡 Insights & Recommendations")
     
@@ -345,11 +493,11 @@ def render_insights_section(df: pd.DataFrame, selected_person: str, full_df: pd.
         st.info("Select a specific person to view personalized insights.")
         
         # Show team insights
-        render_team_insights(full_df)
+        render_team_insights(full_df, data_key)
         return
     
     # Generate insights for selected person
-    insights = generate_coworker_insights(df, selected_person)
+    insights = cached_coworker_insights((data_key, selected_person), selected_person, df)
     
     if insights:
         st.subheader(f"Analysis for {selected_person}")
@@ -358,14 +506,14 @@ def render_insights_section(df: pd.DataFrame, selected_person: str, full_df: pd.
             st.write(insight)
     
     # Performance comparison with team
-    render_person_team_comparison(df, selected_person, full_df)
+    render_person_team_comparison(df, selected_person, full_df, data_key)
 
-def render_team_insights(df: pd.DataFrame):
+def render_team_insights(df: pd.DataFrame, data_key: Tuple):
     """Render team-level insights."""
     st.subheader("Team Overview")
     
     # Overall team metrics
-    team_summary = calculate_coworker_summary_metrics(df)
+    team_summary = cached_summary_metrics((data_key, None), df)
     
     col1, col2 = st.columns(2)
     
@@ -389,23 +537,23 @@ def render_team_insights(df: pd.DataFrame):
         st.write("• Optimize capacity allocation")
         st.write("• Monitor absence trends")
 
-def render_person_team_comparison(person_df: pd.DataFrame, person: str, team_df: pd.DataFrame):
+def render_person_team_comparison(person_df: pd.DataFrame, person: str, team_df: pd.DataFrame,
+                                  data_key: Tuple):
     """Compare person performance against team averages."""
     st.subheader(f"Team Comparison")
     
     # Calculate person metrics
-    person_metrics = calculate_coworker_summary_metrics(person_df)
+    person_metrics = cached_summary_metrics((data_key, person), person_df)
     person_rate = person_metrics.get("overall_billable_rate", 0)
     
-    # Calculate team metrics (excluding the person and "All coworkers")
-    team_only_df = team_df[
-        (team_df["Person"] != person) & 
-        (team_df["Person"] != "All coworkers")
-    ]
+    # Calculate team metrics (excluding the person and "All coworkers") by subtracting
+    # the person's totals from the team totals, which are computed once per dataset
+    team_metrics = cached_team_totals(data_key, team_df)
     
-    if not team_only_df.empty:
-        team_metrics = calculate_coworker_summary_metrics(team_only_df)
-        team_rate = team_metrics.get("overall_billable_rate", 0)
+    if team_metrics.get("unique_persons", 0) > 1:
+        team_capacity = team_metrics.get("total_capacity", 0) - person_metrics.get("total_capacity", 0)
+        team_billable = team_metrics.get("total_project_hours", 0) - person_metrics.get("total_project_hours", 0)
+        team_rate = round(team_billable / team_capacity * 100, 1) if team_capacity > 0 else 0
         
         col1, col2, col3 = st.columns(3)
         
@@ -482,5 +630,4 @@ def should_show_coworker_dashboard(transformed_df: pd.DataFrame) -> bool:
         return False
     
     # Check for required columns
-    required_columns = ["Date", "Person", "Hours worked", "Billable hours"]
-    return all(col in transformed_df.columns for col in required_columns)
\ No newline at end of file
+    return REQUIRED_COWORKER_COLUMNS.issubset(transformed_df.columns)
\ No newline at end of file
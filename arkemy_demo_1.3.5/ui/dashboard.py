@@ -1,17 +1,11 @@
 # dashboard.py
 import streamlit as st
+from functools import wraps
 from utils.processors import calculate_summary_metrics
-from utils.styles import get_tab_css
-from charts.summary_kpis import display_summary_metrics
-from charts.summary_charts import render_summary_tab
-from charts.year_charts import render_year_tab, render_monthly_trends_chart
-from charts.customer_charts import render_customer_tab
-from charts.project_type_charts import render_project_type_tab
-from charts.project_charts import render_project_tab
-from charts.phase_charts import render_phase_tab
-from charts.activity_charts import render_activity_tab
-from charts.people_charts import render_people_tab
-from charts.price_model_charts import render_price_model_tab
+from utils.styles import TAB_CSS
+
+# Chart modules (charts.*) are imported in the navigation branch that renders
+# them, so a session only loads the tabs it actually opens
 
 from utils.processors import (
     aggregate_by_year,
@@ -25,35 +19,140 @@ from utils.processors import (
     aggregate_by_price_model
 )
 
-from charts.capacity_charts import render_capacity_tab
 from utils.chart_styles import render_chart, get_category_colors
+from utils.chart_helpers import dataframe_fingerprint
 from ui.sidebar import render_sidebar_filters
 
+# Navigation options and their radio positions
+MAIN_NAV = ("Company", "Projects", "People", "Clients", "Reports (BETA)")
+COMPANY_NAV = ("KPIs", "Top 10", "Period")
+PERIOD_NAV = ("Yearly View", "Monthly Trends")
+PROJECT_NAV = ("Project details", "Project types", "Price models", "Activity types", "Project Phases")
+PEOPLE_NAV = ("Team Overview",)
+REPORTS_NAV = ("Capacity",)
+
+MAIN_NAV_INDEX = {option: i for i, option in enumerate(MAIN_NAV)}
+COMPANY_NAV_INDEX = {option: i for i, option in enumerate(COMPANY_NAV)}
+PERIOD_NAV_INDEX = {option: i for i, option in enumerate(PERIOD_NAV)}
+PROJECT_NAV_INDEX = {option: i for i, option in enumerate(PROJECT_NAV)}
+PEOPLE_NAV_INDEX = {option: i for i, option in enumerate(PEOPLE_NAV)}
+REPORTS_NAV_INDEX = {option: i for i, option in enumerate(REPORTS_NAV)}
+
+# Low-cardinality columns grouped by the category tabs; stored as pandas categoricals
+# after enrichment so every groupby on them runs on integer codes
+CATEGORY_COLUMNS = ("Project type", "Price model")
+
+# Navigation session state and its defaults, applied once per key
+NAV_STATE_DEFAULTS = (
+    ('main_nav', "Company"),
+    ('company_nav', "KPIs"),
+    ('period_nav', "Yearly View"),
+    ('project_nav', "Project details"),
+    ('prev_project_nav', "Project details"),
+    ('project_nav_counter', 0),
+    ('period_nav_counter', 0),
+    ('prev_period_nav', "Yearly View"),
+    ('people_nav', "Team Overview"),
+    ('reports_nav', "Capacity"),
+)
+
+def freeze_filter_settings(value):
+    """
+    Converts filter settings into a hashable value usable as a cache key.
+    
+    Args:
+        value: Filter settings dict (or a value inside it)
+        
+    Returns:
+        Nested tuples (dicts sorted by key), frozensets for sets, other values unchanged
+    """
+    if isinstance(value, dict):
+        return tuple(
+            (key, freeze_filter_settings(item))
+            for key, item in sorted(value.items(), key=lambda entry: str(entry[0]))
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_filter_settings(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze_filter_settings(item) for item in value)
+    return value
+
+def session_fingerprint(df, state_key):
+    """
+    Returns dataframe_fingerprint(df), hashed only when a different frame object is passed.
+    
+    Args:
+        df: DataFrame to fingerprint
+        state_key: Session state slot remembering the last frame and its fingerprint
+        
+    Returns:
+        Hex digest identifying the frame's columns, dtypes and rows
+    """
+    cached = st.session_state.get(state_key)
+    if cached is not None and cached[0] is df:
+        return cached[1]
+    
+    fingerprint = dataframe_fingerprint(df)
+    st.session_state[state_key] = (df, fingerprint)
+    return fingerprint
+
+@st.cache_data(show_spinner=False)
+def cached_summary_metrics(data_key, _filtered_df):
+    """
+    Calculates the summary metrics, cached so navigation-only reruns reuse them.
+    
+    Args:
+        data_key: Tuple of (source data fingerprint, frozen filter settings) identifying _filtered_df
+        _filtered_df: Filtered time record data (not hashed by Streamlit)
+        
+    Returns:
+        Dictionary containing summary metrics
+    """
+    return calculate_summary_metrics(_filtered_df)
+
+@st.cache_data(show_spinner=False)
+def cached_aggregate(data_key, aggregate_name, options, _df, _aggregate_fn):
+    """
+    Runs an aggregation of the filtered data, cached so tab switches reuse it.
+    
+    Args:
+        data_key: Tuple of (source data fingerprint, frozen filter settings) identifying _df
+        aggregate_name: Name of the aggregation function, part of the cache key
+        options: Sorted (name, value) pairs of keyword arguments for the aggregation
+        _df: Filtered time record data (not hashed by Streamlit)
+        _aggregate_fn: Aggregation function, e.g. aggregate_by_customer (not hashed by Streamlit)
+        
+    Returns:
+        Result of the aggregation function
+    """
+    return _aggregate_fn(_df, **dict(options))
+
+def keyed_aggregate(data_key, aggregate_fn):
+    """
+    Binds an aggregation function to the cache entry of the filtered data.
+    
+    The tab renderers keep their aggregate_by_* callable interface; they call it
+    with the filtered data that data_key identifies.
+    
+    Args:
+        data_key: Tuple of (source data fingerprint, frozen filter settings)
+        aggregate_fn: Aggregation function, e.g. aggregate_by_customer
+        
+    Returns:
+        Callable with the same signature as aggregate_fn
+    """
+    @wraps(aggregate_fn)
+    def aggregate(df, **options):
+        return cached_aggregate(data_key, aggregate_fn.__name__, tuple(sorted(options.items())), df, aggregate_fn)
+    return aggregate
+
 def render_dashboard():
     """
     Renders the analysis dashboard after data has been loaded.
     """
     # Initialize navigation session state
-    if 'main_nav' not in st.session_state:
-        st.session_state.main_nav = "Company"
-    if 'company_nav' not in st.session_state:
-        st.session_state.company_nav = "KPIs"
-    if 'period_nav' not in st.session_state:
-        st.session_state.period_nav = "Yearly View"
-    if 'project_nav' not in st.session_state:
-        st.session_state.project_nav = "Project details"
-    if 'prev_project_nav' not in st.session_state:
-        st.session_state.prev_project_nav = "Project details"
-    if 'project_nav_counter' not in st.session_state:
-        st.session_state.project_nav_counter = 0
-    if 'period_nav_counter' not in st.session_state:
-        st.session_state.period_nav_counter = 0
-    if 'prev_period_nav' not in st.session_state:
-        st.session_state.prev_period_nav = "Yearly View"
-    if 'people_nav' not in st.session_state:
-        st.session_state.people_nav = "Team Overview"
-    if 'reports_nav' not in st.session_state:
-        st.session_state.reports_nav = "Capacity"
+    for key, default in NAV_STATE_DEFAULTS:
+        st.session_state.setdefault(key, default)
     
     # Get data from session state
     transformed_df = st.session_state.transformed_df
@@ -61,161 +160,198 @@ def render_dashboard():
     
     # Check if Person type is already in the main dataframe
     has_person_type_in_main = 'Person type' in transformed_df.columns
-
-    # Enrich dataframes with person reference data if available
-    if 'person_reference_df' in st.session_state and st.session_state.person_reference_df is not None:
-        person_ref_df = st.session_state.person_reference_df
-        
-        # Enrich main dataframe only if Person type doesn't already exist
-        if not has_person_type_in_main:
-            from ui.parquet_processor import cached_enrich_person_data
-            transformed_df = cached_enrich_person_data(transformed_df, person_ref_df)
-            st.session_state.transformed_df = transformed_df
-        else:
-            # Log that we're using existing Person type from main data
-            st.info("Using Person type from main data instead of person reference")
-        
-        # For planned data, also check if main data has Person type
-        if planned_df is not None:
-            if has_person_type_in_main and 'Person type' not in planned_df.columns:
-                # If main data has Person type but planned doesn't, copy person data from main
-                # Create a mapping of person to type from main data
-                person_type_map = transformed_df[['Person', 'Person type']].drop_duplicates().set_index('Person')['Person type']
-                # Apply mapping to planned data
-                planned_df = planned_df.copy()
-                planned_df['Person type'] = planned_df['Person'].map(person_type_map)
-                st.session_state.transformed_planned_df = planned_df
-            elif not has_person_type_in_main and 'Person type' not in planned_df.columns:
-                # Fall back to reference data if needed
+    
+    person_ref_df = st.session_state.get('person_reference_df')
+    project_ref_df = st.session_state.get('project_reference_df')
+    
+    if person_ref_df is not None and has_person_type_in_main:
+        # Log that we're using existing Person type from main data
+        st.info("Using Person type from main data instead of person reference")
+    
+    # Enrichment only needs to run when the data or reference frames change: the
+    # signature holds the frames the last enrichment produced and the references it used
+    enrichment_inputs = (transformed_df, planned_df, person_ref_df, project_ref_df)
+    enrichment_signature = st.session_state.get('enrichment_signature')
+    already_enriched = enrichment_signature is not None and all(
+        current is previous for current, previous in zip(enrichment_inputs, enrichment_signature)
+    )
+    
+    if not already_enriched:
+        # Enrich dataframes with person reference data if available
+        if person_ref_df is not None:
+            # Enrich main dataframe only if Person type doesn't already exist
+            if not has_person_type_in_main:
                 from ui.parquet_processor import cached_enrich_person_data
-                planned_df = cached_enrich_person_data(planned_df, person_ref_df)
-                st.session_state.transformed_planned_df = planned_df
-
-    # Enrich dataframes with project reference data if available
-    if 'project_reference_df' in st.session_state and st.session_state.project_reference_df is not None:
-        project_ref_df = st.session_state.project_reference_df
+                transformed_df = cached_enrich_person_data(transformed_df, person_ref_df)
+            
+            # For planned data, also check if main data has Person type
+            if planned_df is not None:
+                if has_person_type_in_main and 'Person type' not in planned_df.columns:
+                    # If main data has Person type but planned doesn't, copy person data from main
+                    # Create a mapping of person to type from main data (one linear pass;
+                    # the last type seen for a person wins)
+                    person_type_map = dict(zip(
+                        transformed_df['Person'].to_numpy(),
+                        transformed_df['Person type'].to_numpy()
+                    ))
+                    # Apply mapping to planned data; a shallow copy is enough because only
+                    # a new column is added, leaving the original frame's data untouched
+                    planned_df = planned_df.copy(deep=False)
+                    planned_df['Person type'] = planned_df['Person'].map(person_type_map)
+                elif not has_person_type_in_main and 'Person type' not in planned_df.columns:
+                    # Fall back to reference data if needed
+                    from ui.parquet_processor import cached_enrich_person_data
+                    planned_df = cached_enrich_person_data(planned_df, person_ref_df)
+        
+        # Enrich dataframes with project reference data if available
+        if project_ref_df is not None:
+            # Enrich main dataframe
+            from ui.parquet_processor import cached_enrich_project_data
+            transformed_df = cached_enrich_project_data(transformed_df, project_ref_df)
+            
+            # Enrich planned dataframe if available
+            if planned_df is not None:
+                planned_df = cached_enrich_project_data(planned_df, project_ref_df)
         
-        # Enrich main dataframe
-        from ui.parquet_processor import cached_enrich_project_data
-        transformed_df = cached_enrich_project_data(transformed_df, project_ref_df)
-        st.session_state.transformed_df = transformed_df
+        # Convert the category tab columns once instead of on every tab render
+        category_columns = [
+            column for column in CATEGORY_COLUMNS
+            if column in transformed_df.columns and transformed_df[column].dtype == object
+        ]
+        if category_columns:
+            # A shallow copy is enough because the columns are replaced, not modified
+            transformed_df = transformed_df.copy(deep=False)
+            for column in category_columns:
+                transformed_df[column] = transformed_df[column].astype("category")
         
-        # Enrich planned dataframe if available
-        if planned_df is not None:
-            planned_df = cached_enrich_project_data(planned_df, project_ref_df)
+        # Write the frames back once, and only when enrichment produced new objects
+        if transformed_df is not enrichment_inputs[0]:
+            st.session_state.transformed_df = transformed_df
+        if planned_df is not enrichment_inputs[1]:
             st.session_state.transformed_planned_df = planned_df
+        
+        st.session_state.enrichment_signature = (transformed_df, planned_df, person_ref_df, project_ref_df)
     
     # Apply filters from the sidebar to the dataframes
     filtered_df, filtered_planned_df, filter_settings = render_sidebar_filters(transformed_df, planned_df)
     
     # Check if either actual or planned dataframe has data
-    has_actual_data = not filtered_df.empty
-    has_planned_data = filtered_planned_df is not None and not filtered_planned_df.empty
+    has_actual_data = len(filtered_df.index) > 0
+    has_planned_data = filtered_planned_df is not None and len(filtered_planned_df.index) > 0
     has_data = has_actual_data or has_planned_data
 
     if not has_data:
         st.warning("No data in selected range")
         return
         
+    # The filtered data is identified by the source data plus the filter settings,
+    # which is far cheaper than hashing the filtered rows on every rerun
+    data_key = (
+        session_fingerprint(transformed_df, "transformed_df_fingerprint"),
+        freeze_filter_settings(filter_settings)
+    )
+    
     # Calculate summary metrics
-    metrics = calculate_summary_metrics(filtered_df)
+    metrics = cached_summary_metrics(data_key, filtered_df)
 
-    # Apply custom tab styling
-    st.markdown(get_tab_css(), unsafe_allow_html=True)
+    # Apply custom tab styling (emitted every run; Streamlit drops elements a rerun does not send)
+    st.markdown(TAB_CSS, unsafe_allow_html=True)
     
-    # Main navigation
-    st.markdown('<div class="nav-main">', unsafe_allow_html=True)
-    main_nav = st.radio(
-        "Navigation",
-        ["Company", "Projects", "People", "Clients", "Reports (BETA)"],
-        index=["Company", "Projects", "People", "Clients", "Reports (BETA)"].index(st.session_state.main_nav),
-        key='main_nav',
-        horizontal=True
-    )
-    st.markdown('</div>', unsafe_allow_html=True)
+    # Main navigation. Each navigation level sits in its own keyed container
+    with st.container(key="nav_main"):
+        main_nav = st.radio(
+            "Navigation",
+            MAIN_NAV,
+            index=MAIN_NAV_INDEX[st.session_state.main_nav],
+            key='main_nav',
+            horizontal=True
+        )
 
     # Company Section
     if main_nav == "Company":
-        st.markdown('<div class="nav-sub">', unsafe_allow_html=True)
-        company_nav = st.radio(
-            "Company View",
-            ["KPIs", "Top 10", "Period"],
-            index=["KPIs", "Top 10", "Period"].index(st.session_state.company_nav),
-            key='company_nav',
-            horizontal=True
-        )
-        st.markdown('</div>', unsafe_allow_html=True)
+        with st.container(key="nav_sub"):
+            company_nav = st.radio(
+                "Company View",
+                COMPANY_NAV,
+                index=COMPANY_NAV_INDEX[st.session_state.company_nav],
+                key='company_nav',
+                horizontal=True
+            )
         
         if company_nav == "KPIs":
+            from charts.summary_kpis import display_summary_metrics
             display_summary_metrics(metrics)
             
         elif company_nav == "Top 10":
+            from charts.summary_charts import render_summary_tab
             render_summary_tab(
                 filtered_df=filtered_df,
-                filter_settings=filter_settings
+                filter_settings=filter_settings,
+                data_key=data_key
             )
             
         elif company_nav == "Period":
-            st.markdown('<div class="nav-tertiary">', unsafe_allow_html=True)
-            period_nav = st.radio(
-                "Period View",
-                ["Yearly View", "Monthly Trends"],
-                index=["Yearly View", "Monthly Trends"].index(st.session_state.period_nav),
-                key='period_nav',
-                horizontal=True
-            )
-            st.markdown('</div>', unsafe_allow_html=True)
+            with st.container(key="nav_tertiary"):
+                period_nav = st.radio(
+                    "Period View",
+                    PERIOD_NAV,
+                    index=PERIOD_NAV_INDEX[st.session_state.period_nav],
+                    key='period_nav',
+                    horizontal=True
+                )
             
-            # Update session state and counter when period nav changes
+            # Update session state and counter when period nav changes; the tab below
+            # renders with the new counter in this same run, so no extra rerun is needed
             if st.session_state.prev_period_nav != period_nav:
                 st.session_state.prev_period_nav = period_nav
                 st.session_state.period_nav_counter = st.session_state.get('period_nav_counter', 0) + 1
-                # Force a rerun to ensure clean state
-                st.rerun()
             
             if period_nav == "Yearly View":
+                from charts.year_charts import render_year_tab
                 render_year_tab(
                     filtered_df=filtered_df,
-                    aggregate_by_year=aggregate_by_year,
+                    aggregate_by_year=keyed_aggregate(data_key, aggregate_by_year),
                     render_chart=render_chart,
-                    get_category_colors=get_category_colors
+                    get_category_colors=get_category_colors,
+                    data_key=data_key
                 )
             
             elif period_nav == "Monthly Trends":
+                from charts.year_charts import render_monthly_trends_chart
                 render_monthly_trends_chart(
                     filtered_df=filtered_df,
-                    aggregate_by_month_year=aggregate_by_month_year,
+                    aggregate_by_month_year=keyed_aggregate(data_key, aggregate_by_month_year),
                     render_chart=render_chart,
-                    get_category_colors=get_category_colors
+                    get_category_colors=get_category_colors,
+                    data_key=data_key
                 )
 
     # Projects Section
     elif main_nav == "Projects":
-        st.markdown('<div class="nav-sub">', unsafe_allow_html=True)
-        
-        # Use a different key for the radio widget to avoid conflicts
-        project_nav = st.radio(
-            "Project View",
-            ["Project details", "Project types", "Price models", "Activity types", "Project Phases"],
-            index=["Project details", "Project types", "Price models", "Activity types", "Project Phases"].index(st.session_state.project_nav),
-            key='project_nav_radio',  # Different key from session state
-            horizontal=True
-        )
-        st.markdown('</div>', unsafe_allow_html=True)
+        with st.container(key="nav_sub"):
+            # Use a different key for the radio widget to avoid conflicts
+            project_nav = st.radio(
+                "Project View",
+                PROJECT_NAV,
+                # The radio's own state is current before project_nav is synced below
+                index=PROJECT_NAV_INDEX[st.session_state.get('project_nav_radio', st.session_state.project_nav)],
+                key='project_nav_radio',  # Different key from session state
+                horizontal=True
+            )
         
-        # Update session state and counter when tab changes
+        # Update session state and counter when tab changes; the tab below renders
+        # with the new counter in this same run, so no extra rerun is needed
         if st.session_state.project_nav != project_nav:
             st.session_state.prev_project_nav = st.session_state.project_nav
             st.session_state.project_nav = project_nav
             st.session_state.project_nav_counter = st.session_state.get('project_nav_counter', 0) + 1
-            # Force a rerun to ensure clean state
-            st.rerun()
         
         # Render content based on selected tab
         if project_nav == "Project details":
+            from charts.project_charts import render_project_tab
             render_project_tab(
                 filtered_df=filtered_df,
-                aggregate_by_project=aggregate_by_project,
+                aggregate_by_project=keyed_aggregate(data_key, aggregate_by_project),
                 render_chart=render_chart,
                 get_category_colors=get_category_colors,
                 planned_df=filtered_planned_df,
@@ -223,84 +359,86 @@ def render_dashboard():
             )
             
         elif project_nav == "Project types":
+            from charts.project_type_charts import render_project_type_tab
             render_project_type_tab(
                 filtered_df=filtered_df,
-                aggregate_by_project_type=aggregate_by_project_type,
+                aggregate_by_project_type=keyed_aggregate(data_key, aggregate_by_project_type),
                 render_chart=render_chart,
                 get_category_colors=get_category_colors
             )
         
         elif project_nav == "Price models":
+            from charts.price_model_charts import render_price_model_tab
             render_price_model_tab(
                 filtered_df=filtered_df,
-                aggregate_by_price_model=aggregate_by_price_model,
+                aggregate_by_price_model=keyed_aggregate(data_key, aggregate_by_price_model),
                 render_chart=render_chart,
                 get_category_colors=get_category_colors
             )
      
         elif project_nav == "Activity types":
+            from charts.activity_charts import render_activity_tab
             render_activity_tab(
                 filtered_df=filtered_df,
-                aggregate_by_activity=aggregate_by_activity,
+                aggregate_by_activity=keyed_aggregate(data_key, aggregate_by_activity),
                 render_chart=render_chart,
                 get_category_colors=get_category_colors
             )
 
         elif project_nav == "Project Phases":
+            from charts.phase_charts import render_phase_tab
             render_phase_tab(
                 filtered_df=filtered_df,
-                aggregate_by_phase=aggregate_by_phase,
+                aggregate_by_phase=keyed_aggregate(data_key, aggregate_by_phase),
                 render_chart=render_chart,
                 get_category_colors=get_category_colors
             )            
 
     # People Section
     elif main_nav == "People":
-        # Determine available people navigation options
-        people_options = ["Team Overview"]
-        
         # Only show sub-navigation if we have multiple options
-        if len(people_options) > 1:
-            st.markdown('<div class="nav-sub">', unsafe_allow_html=True)
-            people_nav = st.radio(
-                "People View",
-                people_options,
-                index=people_options.index(st.session_state.people_nav) if st.session_state.people_nav in people_options else 0,
-                key='people_nav',
-                horizontal=True
-            )
-            st.markdown('</div>', unsafe_allow_html=True)
+        if len(PEOPLE_NAV) > 1:
+            with st.container(key="nav_sub"):
+                people_nav = st.radio(
+                    "People View",
+                    PEOPLE_NAV,
+                    index=PEOPLE_NAV_INDEX.get(st.session_state.people_nav, 0),
+                    key='people_nav',
+                    horizontal=True
+                )
         else:
             people_nav = "Team Overview"
         
         if people_nav == "Team Overview":
+            from charts.people_charts import render_people_tab
             render_people_tab(
                 filtered_df=filtered_df,
-                aggregate_by_person=aggregate_by_person,
+                aggregate_by_person=keyed_aggregate(data_key, aggregate_by_person),
                 render_chart=render_chart,
                 get_category_colors=get_category_colors
             )
             
     # Clients Section
     elif main_nav == "Clients":
+        from charts.customer_charts import render_customer_tab
         render_customer_tab(
             filtered_df=filtered_df,
-            aggregate_by_customer=aggregate_by_customer,
+            aggregate_by_customer=keyed_aggregate(data_key, aggregate_by_customer),
             render_chart=render_chart,
             get_category_colors=get_category_colors
         )
     
     # Reports Section
     elif main_nav == "Reports (BETA)":
-        st.markdown('<div class="nav-sub">', unsafe_allow_html=True)
-        reports_nav = st.radio(
-            "Reports View",
-            ["Capacity"],
-            index=["Capacity"].index(st.session_state.reports_nav),
-            key='reports_nav',
-            horizontal=True
-        )
-        st.markdown('</div>', unsafe_allow_html=True)
+        with st.container(key="nav_sub"):
+            reports_nav = st.radio(
+                "Reports View",
+                REPORTS_NAV,
+                index=REPORTS_NAV_INDEX[st.session_state.reports_nav],
+                key='reports_nav',
+                horizontal=True
+            )
         
         if reports_nav == "Capacity":
+            from charts.capacity_charts import render_capacity_tab
             render_capacity_tab(filtered_df=filtered_df, filter_settings=filter_settings, planned_df=filtered_planned_df)
\ No newline at end of file
@@ -8,6 +8,7 @@ from utils.data_validation import validate_csv_schema, transform_csv, display_va
 from utils.planned_validation import validate_planned_schema, transform_planned_csv, display_planned_validation_results
 from utils.person_reference import enrich_person_data
 from utils.project_reference import enrich_project_data
+from utils.enrichment_cache import load_or_enrich
 from utils.planned_processors import calculate_planned_summary_metrics
 
 # Import capacity-related functions
@@ -113,13 +114,13 @@ def cached_transform_planned_csv(df):
 
 @st.cache_data
 def cached_enrich_person_data(df, reference_df):
-    """Cached wrapper for enrich_person_data function"""
-    return enrich_person_data(df, reference_df)
+    """Cached wrapper for enrich_person_data function, backed by the on-disk enrichment cache"""
+    return load_or_enrich(df, reference_df, enrich_person_data)
 
 @st.cache_data
 def cached_enrich_project_data(df, reference_df):
-    """Cached wrapper for enrich_project_data function"""
-    return enrich_project_data(df, reference_df)
+    """Cached wrapper for enrich_project_data function, backed by the on-disk enrichment cache"""
+    return load_or_enrich(df, reference_df, enrich_project_data)
 
 # Add cached wrappers for capacity functions
 @st.cache_data
@@ -11,7 +11,8 @@ from utils.filters import (
     create_project_effective_rate_filter,  # New import
     create_billability_filter,
     create_project_type_filter,
-    create_price_model_filter
+    create_price_model_filter,
+    reuse_filter_result
 )
 from utils.filter_display import display_filter_badges
 from utils.project_reference import get_dynamic_project_filters
@@ -20,24 +21,32 @@ def render_sidebar_filters(df, planned_df=None):
     """
     Render filter controls in the sidebar and return filtered dataframes and settings.
     """
-    # Create a copy of the input dataframe to avoid modifying the original
-    filtered_df = df.copy()
+    # Create a shallow copy of the input dataframe so column assignments (such as the
+    # date filter's Date conversion) leave the original untouched; the column data is
+    # shared with the session's frame instead of being duplicated. Made once per input
+    # frame; filter stages reuse their results while it is unchanged.
+    filtered_df = reuse_filter_result('source', df, None, lambda: df.copy(deep=False))
     filter_settings = {}
 
     # Create a copy of planned_df and apply Person type mapping if needed
     if planned_df is not None:
-        filtered_planned_df = planned_df.copy()
-        
-        # Create a mapping of Person → Person type from the main data
-        if 'Person type' in df.columns:
-            person_type_map = df[['Person', 'Person type']].drop_duplicates().set_index('Person')['Person type']
+        def prepare_planned_df():
+            prepared_df = planned_df.copy()
             
-            # Apply this mapping directly to filtered_planned_df
-            filtered_planned_df['Person type'] = filtered_planned_df['Person'].map(person_type_map)
+            # Create a mapping of Person → Person type from the main data
+            if 'Person type' in df.columns:
+                person_type_map = df[['Person', 'Person type']].drop_duplicates().set_index('Person')['Person type']
+                
+                # Apply this mapping directly to prepared_df
+                prepared_df['Person type'] = prepared_df['Person'].map(person_type_map)
+                
+                # Handle any persons in planned data that aren't in main data
+                if prepared_df['Person type'].isna().any():
+                    st.debug.info(f"Note: {prepared_df['Person type'].isna().sum()} persons in planned data not found in main data")
             
-            # Handle any persons in planned data that aren't in main data
-            if filtered_planned_df['Person type'].isna().any():
-                st.debug.info(f"Note: {filtered_planned_df['Person type'].isna().sum()} persons in planned data not found in main data")
+            return prepared_df
+        
+        filtered_planned_df = reuse_filter_result('planned_source', (planned_df, df), None, prepare_planned_df)
     else:
         filtered_planned_df = None    
 
@@ -45,11 +54,17 @@ def render_sidebar_filters(df, planned_df=None):
     if 'project_reference_df' in st.session_state and st.session_state.project_reference_df is not None:
         try:
             # Always call the function to render UI
+            source_df = filtered_df
             temp_df, project_meta_settings, handled_columns = get_dynamic_project_filters(
-                filtered_df, st.session_state.project_reference_df
+                source_df, st.session_state.project_reference_df
             )
             
-            filtered_df = temp_df
+            # Keep the previous result while the selections are unchanged so the
+            # filter stages below see the same input frame
+            filtered_df = reuse_filter_result(
+                'project_metadata', (source_df, st.session_state.project_reference_df),
+                project_meta_settings, lambda: temp_df
+            )
             filter_settings.update(project_meta_settings)
                 
             if filtered_df.empty:
@@ -84,35 +99,50 @@ def render_sidebar_filters(df, planned_df=None):
     
     # Apply matching filters to planned data if available
     if filtered_planned_df is not None:
-        # Match project filters if applicable
-        if 'included_projects' in filter_settings and filter_settings['included_projects']:
-            filtered_planned_df = filtered_planned_df[filtered_planned_df['Project number'].isin(filter_settings['included_projects'])]
+        planned_source_df = filtered_planned_df
+        
+        def apply_planned_filters():
+            filtered_planned_df = planned_source_df
+            
+            # Match project filters if applicable
+            if 'included_projects' in filter_settings and filter_settings['included_projects']:
+                filtered_planned_df = filtered_planned_df[filtered_planned_df['Project number'].isin(filter_settings['included_projects'])]
         
-        # Match excluded project filters if applicable
-        if 'excluded_projects' in filter_settings and filter_settings['excluded_projects']:
-            filtered_planned_df = filtered_planned_df[~filtered_planned_df['Project number'].isin(filter_settings['excluded_projects'])]
+            # Match excluded project filters if applicable
+            if 'excluded_projects' in filter_settings and filter_settings['excluded_projects']:
+                filtered_planned_df = filtered_planned_df[~filtered_planned_df['Project number'].isin(filter_settings['excluded_projects'])]
         
-        # Match date filters if applicable
-        if 'start_date' in filter_settings and 'end_date' in filter_settings:
-            # Check if Date column exists in planned_df
-            if 'Date' in filtered_planned_df.columns:
-                # Apply date filter to planned data
-                start_date = filter_settings['start_date']
-                end_date = filter_settings['end_date']
-                filtered_planned_df = filtered_planned_df[
-                    (filtered_planned_df['Date'].dt.date >= start_date) & 
-                    (filtered_planned_df['Date'].dt.date <= end_date)
-                ]
+            # Match date filters if applicable
+            if 'start_date' in filter_settings and 'end_date' in filter_settings:
+                # Check if Date column exists in planned_df
+                if 'Date' in filtered_planned_df.columns:
+                    # Apply date filter to planned data
+                    start_date = filter_settings['start_date']
+                    end_date = filter_settings['end_date']
+                    filtered_planned_df = filtered_planned_df[
+                        (filtered_planned_df['Date'].dt.date >= start_date) & 
+                        (filtered_planned_df['Date'].dt.date <= end_date)
+                    ]
 
-            # Apply person type filter if applicable
-            if 'selected_person_type' in filter_settings and filter_settings['selected_person_type'] != 'all':
-                # Check if Person type column exists in planned_df
-                if 'Person type' in filtered_planned_df.columns:
-                    # Apply person type filter to planned data
-                    if filter_settings['selected_person_type'] == 'internal':
-                        filtered_planned_df = filtered_planned_df[filtered_planned_df['Person type'].fillna('').str.lower() == 'internal']
-                    elif filter_settings['selected_person_type'] == 'external':
-                        filtered_planned_df = filtered_planned_df[filtered_planned_df['Person type'].fillna('').str.lower() == 'external']
+                # Apply person type filter if applicable
+                if 'selected_person_type' in filter_settings and filter_settings['selected_person_type'] != 'all':
+                    # Check if Person type column exists in planned_df
+                    if 'Person type' in filtered_planned_df.columns:
+                        # Apply person type filter to planned data
+                        if filter_settings['selected_person_type'] == 'internal':
+                            filtered_planned_df = filtered_planned_df[filtered_planned_df['Person type'].fillna('').str.lower() == 'internal']
+                        elif filter_settings['selected_person_type'] == 'external':
+                            filtered_planned_df = filtered_planned_df[filtered_planned_df['Person type'].fillna('').str.lower() == 'external']
+            
+            return filtered_planned_df
+        
+        planned_stage_key = tuple(
+            filter_settings.get(setting)
+            for setting in ('included_projects', 'excluded_projects', 'start_date', 'end_date', 'selected_person_type')
+        )
+        filtered_planned_df = reuse_filter_result(
+            'planned', planned_source_df, planned_stage_key, apply_planned_filters
+        )
  
     # Display filter badges after all filters have been processed
     display_filter_badges(filter_settings, location="sidebar")
@@ -1,134 +1,190 @@
 # chart_helpers.py
+import hashlib
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 from datetime import datetime
 import numpy as np
+import pyarrow as pa
 
-def create_standardized_customdata(df):
+# Metrics that can legitimately be negative and are filtered on != 0 instead of > 0
+PROFIT_METRICS = frozenset({"Total profit", "Profit margin %"})
+
+# Default cap on treemap tiles; beyond this a slider lets the user raise it
+TREEMAP_MAX_TILES = 50
+
+# Columns packed into custom_data, in the index order used by the hover templates
+CUSTOMDATA_COLUMNS = [
+    "Hours worked",                 # [0]
+    "Billable hours",               # [1]
+    "Billability %",                # [2]
+    "Number of people",             # [3] Number of people/projects
+    "Billable rate",                # [4]
+    "Effective rate",               # [5]
+    "Revenue",                      # [6]
+    "Planned hours",                # [7]
+    "Planned rate",                 # [8]
+    "Planned revenue",              # [9]
+    "Hours variance",               # [10] Hours variance (absolute)
+    "Variance percentage",          # [11] Hours variance (%)
+    "Rate variance",                # [12] Rate variance (absolute)
+    "Rate variance percentage",     # [13] Rate variance (%)
+    "Revenue variance",             # [14] Revenue variance (absolute)
+    "Revenue variance percentage",  # [15] Revenue variance (%)
+    "Total cost",                   # [16]
+    "Total profit",                 # [17]
+    "Profit margin %",              # [18]
+]
+
+def create_standardized_customdata(df, dtype="float64"):
     """
     Creates standardized custom data array for consistent hover templates.
     
     Args:
         df: DataFrame containing project or monthly metrics
+        dtype: Float dtype of the returned array (float32 halves the chart payload)
         
     Returns:
-        List of lists to be used as custom_data in Plotly charts
+        2-D NumPy array with one row per entry in CUSTOMDATA_COLUMNS (missing
+        columns are zero-filled), to be used as custom_data in Plotly charts
     """
-    custom_data = []
-    
-    # [0] Hours worked
-    custom_data.append(df["Hours worked"])
-    
-    # [1] Billable hours
-    if "Billable hours" in df.columns:
-        custom_data.append(df["Billable hours"])
-    else:
-        custom_data.append([0] * len(df))
+    # Single allocation, filled one metric row at a time
+    custom_data = np.zeros((len(CUSTOMDATA_COLUMNS), len(df)), dtype=dtype)
     
-    # [2] Billability %
-    if "Billability %" in df.columns:
-        custom_data.append(df["Billability %"])
-    else:
-        custom_data.append([0] * len(df))
+    for i, column in enumerate(CUSTOMDATA_COLUMNS):
+        if column in df.columns:
+            custom_data[i] = df[column].to_numpy(dtype=dtype, na_value=np.nan)
     
-    # [3] Number of people/projects
-    if "Number of people" in df.columns:
-        custom_data.append(df["Number of people"])
-    else:
-        custom_data.append([0] * len(df))
-    
-    # [4] Billable rate
-    if "Billable rate" in df.columns:
-        custom_data.append(df["Billable rate"])
-    else:
-        custom_data.append([0] * len(df))
+    return custom_data
+
+def ensure_column_major(df):
+    """
+    Ensures every column of a DataFrame is backed by a contiguous array.
     
-    # [5] Effective rate
-    if "Effective rate" in df.columns:
-        custom_data.append(df["Effective rate"])
-    else:
-        custom_data.append([0] * len(df))
+    Plotly reads the data one column at a time when serializing, so strided
+    columns are copied into contiguous storage. Frames that are already
+    column-contiguous are returned unchanged without copying.
     
-    # [6] Revenue
-    if "Revenue" in df.columns:
-        custom_data.append(df["Revenue"])
-    else:
-        custom_data.append([0] * len(df))
-    
-    # [7] Planned hours
-    if "Planned hours" in df.columns:
-        custom_data.append(df["Planned hours"])
-    else:
-        custom_data.append([0] * len(df))
+    Args:
+        df: DataFrame to check
+        
+    Returns:
+        DataFrame whose columns are all contiguous in memory
+    """
+    strided_columns = [
+        column for column in df.columns
+        if not df[column].to_numpy().flags.c_contiguous
+    ]
     
-    # [8] Planned rate
-    if "Planned rate" in df.columns:
-        custom_data.append(df["Planned rate"])
-    else:
-        custom_data.append([0] * len(df))
+    if not strided_columns:
+        return df
     
-    # [9] Planned revenue
-    if "Planned revenue" in df.columns:
-        custom_data.append(df["Planned revenue"])
-    else:
-        custom_data.append([0] * len(df))
+    return df.assign(**{
+        column: np.ascontiguousarray(df[column].to_numpy())
+        for column in strided_columns
+    })
+
+def downcast_for_plotting(df):
+    """
+    Casts float64 columns to float32 for charting.
     
-    # [10] Hours variance (absolute)
-    if "Hours variance" in df.columns:
-        custom_data.append(df["Hours variance"])
-    else:
-        custom_data.append([0] * len(df))
+    Display precision does not need float64, and float32 halves the bytes
+    Plotly serializes to the browser. Keep tables on the original frame.
     
-    # [11] Hours variance (%)
-    if "Variance percentage" in df.columns:
-        custom_data.append(df["Variance percentage"])
-    else:
-        custom_data.append([0] * len(df))
+    Args:
+        df: DataFrame to be plotted
+        
+    Returns:
+        Copy of df with float64 columns stored as float32
+    """
+    float_columns = df.select_dtypes(include="float64").columns
+    return df.astype({column: "float32" for column in float_columns})
+
+def dataframe_fingerprint(df):
+    """
+    Computes a content fingerprint for a DataFrame.
     
-    # [12] Rate variance (absolute)
-    if "Rate variance" in df.columns:
-        custom_data.append(df["Rate variance"])
-    else:
-        custom_data.append([0] * len(df))
+    Args:
+        df: DataFrame to fingerprint
+        
+    Returns:
+        Hex digest covering the column names, dtypes and the rows in order
+    """
+    digest = hashlib.blake2b(repr((list(df.columns), [str(dtype) for dtype in df.dtypes])).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def get_or_build_figure(state_key, figure_key, build_figure):
+    """
+    Returns a Plotly figure persisted in session state, rebuilding it only when its inputs change.
     
-    # [13] Rate variance (%)
-    if "Rate variance percentage" in df.columns:
-        custom_data.append(df["Rate variance percentage"])
-    else:
-        custom_data.append([0] * len(df))
+    Args:
+        state_key: Session state slot holding the chart's last figure
+        figure_key: Hashable description of the figure inputs (metric, chart type, data fingerprint, ...)
+        build_figure: Zero-argument callable that constructs the figure
+        
+    Returns:
+        Plotly figure
+    """
+    cached = st.session_state.get(state_key)
+    if cached is not None and cached[0] == figure_key:
+        return cached[1]
     
-    # [14] Revenue variance (absolute)
-    if "Revenue variance" in df.columns:
-        custom_data.append(df["Revenue variance"])
-    else:
-        custom_data.append([0] * len(df))
+    fig = build_figure()
+    st.session_state[state_key] = (figure_key, fig)
+    return fig
+
+def top_n_positions(metric_values, n, by_magnitude=False):
+    """
+    Returns the row positions of the n largest metric values, largest first.
     
-    # [15] Revenue variance (%)
-    if "Revenue variance percentage" in df.columns:
-        custom_data.append(df["Revenue variance percentage"])
-    else:
-        custom_data.append([0] * len(df))
+    Args:
+        metric_values: 1-D array of metric values
+        n: Number of positions to keep
+        by_magnitude: Rank by absolute value (profit metrics, so large losses are kept too)
+        
+    Returns:
+        Integer array of at most n positions
+    """
+    ranking = np.abs(metric_values) if by_magnitude else metric_values
+    return np.argsort(-ranking, kind="stable")[:n]
+
+@st.cache_data
+def sort_by_metric(df, metric):
+    """
+    Sorts an aggregated DataFrame by a metric in descending order.
     
-    # [16] Total cost
-    if "Total cost" in df.columns:
-        custom_data.append(df["Total cost"])
-    else:
-        custom_data.append([0] * len(df))
+    Cached so the default "Hours worked" ordering is reused across reruns
+    and shared between the bar chart and the data table.
     
-    # [17] Total profit
-    if "Total profit" in df.columns:
-        custom_data.append(df["Total profit"])
-    else:
-        custom_data.append([0] * len(df))
+    Args:
+        df: Aggregated DataFrame
+        metric: Column to sort by
+        
+    Returns:
+        DataFrame sorted by metric in descending order
+    """
+    return df.sort_values(metric, ascending=False)
+
+@st.cache_data
+def to_arrow_table(df):
+    """
+    Converts a DataFrame to an Arrow table for st.dataframe.
     
-    # [18] Profit margin %
-    if "Profit margin %" in df.columns:
-        custom_data.append(df["Profit margin %"])
-    else:
-        custom_data.append([0] * len(df))
+    Cached so an unchanged table is not re-converted on every rerun.
     
-    return custom_data
+    Args:
+        df: DataFrame to display
+        
+    Returns:
+        pyarrow.Table without the pandas index
+    """
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+@st.cache_data
+def cached_standardized_customdata(df, dtype="float64"):
+    """Cached wrapper so custom data for an unchanged frame is built once and sliced per chart"""
+    return create_standardized_customdata(df, dtype)
 
 # Replace the create_comparison_chart function in chart_helpers.py with this version
 
@@ -0,0 +1,99 @@
+# utils/enrichment_cache.py
+import hashlib
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Per-user directory for enriched frames shared by all sessions and restarts of the app
+ENRICHMENT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "arkemy", "enrichment"
+)
+
+# Bump when the enrichment output changes in a way the function bytecode does not show
+ENRICHMENT_CACHE_VERSION = 1
+
+# Number of cached enrichment files kept; the least recently used are pruned on write
+ENRICHMENT_CACHE_MAX_FILES = 16
+
+def enrichment_cache_key(df, reference_df, enrich_fn):
+    """
+    Computes a content hash identifying one enrichment run.
+
+    Args:
+        df: DataFrame to enrich
+        reference_df: Reference DataFrame with the attributes to add
+        enrich_fn: Enrichment function, e.g. enrich_person_data
+
+    Returns:
+        Hex digest covering the cache version, the function name and bytecode,
+        and both frames' columns, dtypes, index and rows
+    """
+    digest = hashlib.blake2b(f"{ENRICHMENT_CACHE_VERSION}:{enrich_fn.__name__}".encode())
+    digest.update(enrich_fn.__code__.co_code)
+    for frame in (df, reference_df):
+        digest.update(repr((list(frame.columns), [str(dtype) for dtype in frame.dtypes])).encode())
+        digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def prune_enrichment_cache(cache_dir=ENRICHMENT_CACHE_DIR, max_files=ENRICHMENT_CACHE_MAX_FILES):
+    """
+    Removes the least recently used cached files beyond max_files.
+    
+    Args:
+        cache_dir: Directory holding the cached Parquet files
+        max_files: Number of files to keep
+    """
+    paths = [
+        os.path.join(cache_dir, name) for name in os.listdir(cache_dir)
+        if name.endswith(".parquet")
+    ]
+    paths.sort(key=os.path.getmtime, reverse=True)
+    for path in paths[max_files:]:
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"Error pruning enrichment cache {path}: {str(e)}")
+
+def load_or_enrich(df, reference_df, enrich_fn, cache_dir=ENRICHMENT_CACHE_DIR):
+    """
+    Returns the enriched DataFrame from the on-disk Parquet cache, enriching and storing it on a miss.
+
+    Args:
+        df: DataFrame to enrich
+        reference_df: Reference DataFrame with the attributes to add
+        enrich_fn: Enrichment function taking (df, reference_df)
+        cache_dir: Directory holding the cached Parquet files
+
+    Returns:
+        Enriched DataFrame
+    """
+    if df is None or reference_df is None:
+        return enrich_fn(df, reference_df)
+
+    path = os.path.join(cache_dir, f"{enrichment_cache_key(df, reference_df, enrich_fn)}.parquet")
+    if os.path.exists(path):
+        try:
+            enriched_df = pq.read_table(path, memory_map=True).to_pandas()
+            # Mark the file as recently used so pruning keeps it
+            os.utime(path)
+            return enriched_df
+        except Exception as e:
+            print(f"Error reading enrichment cache {path}: {str(e)}")
+
+    enriched_df = enrich_fn(df, reference_df)
+
+    try:
+        # The files hold business data (fees, costs, people), so only the app's user may read them
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        os.chmod(cache_dir, 0o700)
+        # Write to a temporary name first so concurrent sessions never read a partial file
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        pq.write_table(pa.Table.from_pandas(enriched_df), temp_path, compression='zstd')
+        os.replace(temp_path, path)
+        prune_enrichment_cache(cache_dir)
+    except Exception as e:
+        print(f"Error writing enrichment cache {path}: {str(e)}")
+
+    return enriched_df
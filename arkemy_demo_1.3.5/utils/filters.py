@@ -19,6 +19,39 @@ def clear_rerun_lock():
         del st.session_state.indicator_rerun_lock
 
 
+def reuse_filter_result(stage: str, df: pd.DataFrame, stage_key: Any, apply_filter):
+    """
+    Returns a filter stage's result from session state while its input and selections are unchanged.
+
+    Reruns that only change navigation pass the same input frame and selections to
+    every stage, so each stage hands back its previous frame instead of masking again,
+    which in turn keeps the next stage's input identical.
+
+    Args:
+        stage: Name of the filter stage (session state slot)
+        df: Input frame of the stage, or a tuple of input frames, compared by identity
+        stage_key: Comparable description of the selections the result depends on
+        apply_filter: Zero-argument callable computing the result
+
+    Returns:
+        Result of apply_filter, reused from the previous run when possible
+    """
+    inputs = df if isinstance(df, tuple) else (df,)
+    stage_cache = st.session_state.setdefault('filter_stage_cache', {})
+    cached = stage_cache.get(stage)
+    if (
+        cached is not None
+        and len(cached[0]) == len(inputs)
+        and all(previous is current for previous, current in zip(cached[0], inputs))
+        and cached[1] == stage_key
+    ):
+        return cached[2]
+
+    result = apply_filter()
+    stage_cache[stage] = (inputs, stage_key, result)
+    return result
+
+
 def create_date_filters(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """Create BI-friendly date range filters for the dataframe."""
     clear_rerun_lock()
@@ -69,8 +102,10 @@ def create_date_filters(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]
         range_description = "Error in selection"
     
     # Apply the filter
-    mask = (df['Date'].dt.date >= start_date) & (df['Date'].dt.date <= end_date)
-    filtered_df = df[mask]
+    filtered_df = reuse_filter_result(
+        'date', df, (start_date, end_date),
+        lambda: df[(df['Date'].dt.date >= start_date) & (df['Date'].dt.date <= end_date)]
+    )
     
     # Update filter settings for compatibility with existing code
     filter_settings.update({
@@ -97,9 +132,12 @@ def create_customer_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, An
     if 'Customer number' not in df.columns or 'Customer name' not in df.columns:
         return df, filter_settings
     
-    customers = df[['Customer number', 'Customer name']].drop_duplicates()
-    customers['Customer'] = customers['Customer name'] + ' (' + customers['Customer number'] + ')'
-    customer_options = customers['Customer'].tolist()
+    def build_customer_options():
+        customers = df[['Customer number', 'Customer name']].drop_duplicates()
+        customers['Customer'] = customers['Customer name'] + ' (' + customers['Customer number'] + ')'
+        return customers['Customer'].tolist()
+    
+    customer_options = reuse_filter_result('customer_options', df, None, build_customer_options)
     
     # Use current state for indicator
     current_included = st.session_state.get('customer_included', [])
@@ -123,15 +161,22 @@ def create_customer_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, An
             on_change=trigger_rerun
         )
     
-    filtered_df = df.copy()
-    
-    if selected_customers:
-        included_ids = [c.split('(')[-1].split(')')[0] for c in selected_customers]
-        filtered_df = filtered_df[filtered_df['Customer number'].isin(included_ids)]
+    def apply_customer_filter():
+        filtered_df = df
+        
+        if selected_customers:
+            included_ids = [c.split('(')[-1].split(')')[0] for c in selected_customers]
+            filtered_df = filtered_df[filtered_df['Customer number'].isin(included_ids)]
+        
+        if exclude_customers:
+            excluded_ids = [c.split('(')[-1].split(')')[0] for c in exclude_customers]
+            filtered_df = filtered_df[~filtered_df['Customer number'].isin(excluded_ids)]
+        
+        return filtered_df
     
-    if exclude_customers:
-        excluded_ids = [c.split('(')[-1].split(')')[0] for c in exclude_customers]
-        filtered_df = filtered_df[~filtered_df['Customer number'].isin(excluded_ids)]
+    filtered_df = reuse_filter_result(
+        'customer', df, (list(selected_customers), list(exclude_customers)), apply_customer_filter
+    )
     
     filter_settings['include_all_customers'] = len(selected_customers) == 0
     filter_settings['included_customers'] = [c.split('(')[-1].split(')')[0] for c in selected_customers]
@@ -150,9 +195,12 @@ def create_project_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any
     if not has_project_data:
         return df, filter_settings
     
-    projects = df[['Project number', 'Project']].drop_duplicates()
-    projects['Project label'] = projects['Project'] + ' (' + projects['Project number'] + ')'
-    project_options = projects['Project label'].tolist()
+    def build_project_options():
+        projects = df[['Project number', 'Project']].drop_duplicates()
+        projects['Project label'] = projects['Project'] + ' (' + projects['Project number'] + ')'
+        return projects['Project label'].tolist()
+    
+    project_options = reuse_filter_result('project_options', df, None, build_project_options)
     
     current_included = st.session_state.get('project_included', [])
     current_excluded = st.session_state.get('project_excluded', [])
@@ -175,15 +223,22 @@ def create_project_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any
             on_change=trigger_rerun
         )
     
-    filtered_df = df.copy()
-    
-    if selected_projects:
-        included_ids = [p.split('(')[-1].split(')')[0] for p in selected_projects]
-        filtered_df = filtered_df[filtered_df['Project number'].isin(included_ids)]
+    def apply_project_filter():
+        filtered_df = df
+        
+        if selected_projects:
+            included_ids = [p.split('(')[-1].split(')')[0] for p in selected_projects]
+            filtered_df = filtered_df[filtered_df['Project number'].isin(included_ids)]
+        
+        if exclude_projects:
+            excluded_ids = [p.split('(')[-1].split(')')[0] for p in exclude_projects]
+            filtered_df = filtered_df[~filtered_df['Project number'].isin(excluded_ids)]
+        
+        return filtered_df
     
-    if exclude_projects:
-        excluded_ids = [p.split('(')[-1].split(')')[0] for p in exclude_projects]
-        filtered_df = filtered_df[~filtered_df['Project number'].isin(excluded_ids)]
+    filtered_df = reuse_filter_result(
+        'project', df, (list(selected_projects), list(exclude_projects)), apply_project_filter
+    )
     
     filter_settings['include_all_projects'] = len(selected_projects) == 0
     filter_settings['included_projects'] = [p.split('(')[-1].split(')')[0] for p in selected_projects]
@@ -200,7 +255,7 @@ def create_project_type_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str
     if 'Project type' not in df.columns:
         return df, filter_settings
     
-    project_types = sorted(df['Project type'].unique().tolist())
+    project_types = reuse_filter_result('project_type_options', df, None, lambda: sorted(df['Project type'].unique().tolist()))
     
     current_included = st.session_state.get('project_type_included', [])
     current_excluded = st.session_state.get('project_type_excluded', [])
@@ -223,13 +278,20 @@ def create_project_type_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str
             on_change=trigger_rerun
         )
     
-    filtered_df = df.copy()
-    
-    if selected_types:
-        filtered_df = filtered_df[filtered_df['Project type'].isin(selected_types)]
+    def apply_project_type_filter():
+        filtered_df = df
+        
+        if selected_types:
+            filtered_df = filtered_df[filtered_df['Project type'].isin(selected_types)]
+        
+        if exclude_types:
+            filtered_df = filtered_df[~filtered_df['Project type'].isin(exclude_types)]
+        
+        return filtered_df
     
-    if exclude_types:
-        filtered_df = filtered_df[~filtered_df['Project type'].isin(exclude_types)]
+    filtered_df = reuse_filter_result(
+        'project_type', df, (list(selected_types), list(exclude_types)), apply_project_type_filter
+    )
     
     filter_settings['include_all_types'] = len(selected_types) == 0
     filter_settings['included_types'] = selected_types
@@ -247,7 +309,7 @@ def create_price_model_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str,
     if 'Price model' not in df.columns:
         return df, filter_settings
     
-    price_models = sorted(df['Price model'].unique().tolist())
+    price_models = reuse_filter_result('price_model_options', df, None, lambda: sorted(df['Price model'].unique().tolist()))
     
     current_included = st.session_state.get('price_model_included', [])
     current_excluded = st.session_state.get('price_model_excluded', [])
@@ -270,13 +332,20 @@ def create_price_model_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str,
             on_change=trigger_rerun
         )
     
-    filtered_df = df.copy()
-    
-    if selected_models:
-        filtered_df = filtered_df[filtered_df['Price model'].isin(selected_models)]
+    def apply_price_model_filter():
+        filtered_df = df
+        
+        if selected_models:
+            filtered_df = filtered_df[filtered_df['Price model'].isin(selected_models)]
+        
+        if exclude_models:
+            filtered_df = filtered_df[~filtered_df['Price model'].isin(exclude_models)]
+        
+        return filtered_df
     
-    if exclude_models:
-        filtered_df = filtered_df[~filtered_df['Price model'].isin(exclude_models)]
+    filtered_df = reuse_filter_result(
+        'price_model', df, (list(selected_models), list(exclude_models)), apply_price_model_filter
+    )
     
     filter_settings['include_all_models'] = len(selected_models) == 0
     filter_settings['included_models'] = selected_models
@@ -296,12 +365,12 @@ def create_activity_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, An
     if not has_activity and not has_phase:
         return df, filter_settings
     
-    filtered_df = df.copy()
+    filtered_df = df
     phase_active = False
     activity_active = False
     
     if has_phase:
-        phases = sorted(df['Phase'].unique().tolist())
+        phases = reuse_filter_result('phase_options', df, None, lambda: sorted(df['Phase'].unique().tolist()))
         current_included = st.session_state.get('phase_included', [])
         current_excluded = st.session_state.get('phase_excluded', [])
         indicator = " 🔴" if (current_included or current_excluded) else ""
@@ -323,11 +392,20 @@ def create_activity_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, An
                 on_change=trigger_rerun
             )
         
-        if selected_phases:
-            filtered_df = filtered_df[filtered_df['Phase'].isin(selected_phases)]
+        def apply_phase_filter():
+            phase_df = df
+            
+            if selected_phases:
+                phase_df = phase_df[phase_df['Phase'].isin(selected_phases)]
+            
+            if exclude_phases:
+                phase_df = phase_df[~phase_df['Phase'].isin(exclude_phases)]
+            
+            return phase_df
         
-        if exclude_phases:
-            filtered_df = filtered_df[~filtered_df['Phase'].isin(exclude_phases)]
+        filtered_df = reuse_filter_result(
+            'phase', df, (list(selected_phases), list(exclude_phases)), apply_phase_filter
+        )
             
         filter_settings['include_all_phases'] = len(selected_phases) == 0
         filter_settings['included_phases'] = selected_phases
@@ -335,7 +413,11 @@ def create_activity_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, An
         phase_active = len(selected_phases) > 0 or len(exclude_phases) > 0
     
     if has_activity:
-        activities = sorted(filtered_df['Activity'].unique().tolist())
+        activity_input_df = filtered_df
+        activities = reuse_filter_result(
+            'activity_options', activity_input_df, None,
+            lambda: sorted(activity_input_df['Activity'].unique().tolist())
+        )
         current_included = st.session_state.get('activity_included', [])
         current_excluded = st.session_state.get('activity_excluded', [])
         indicator = " 🔴" if (current_included or current_excluded) else ""
@@ -357,11 +439,21 @@ def create_activity_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, An
                 on_change=trigger_rerun
             )
         
-        if selected_activities:
-            filtered_df = filtered_df[filtered_df['Activity'].isin(selected_activities)]
+        def apply_activity_filter():
+            activity_df = activity_input_df
+            
+            if selected_activities:
+                activity_df = activity_df[activity_df['Activity'].isin(selected_activities)]
+            
+            if exclude_activities:
+                activity_df = activity_df[~activity_df['Activity'].isin(exclude_activities)]
+            
+            return activity_df
         
-        if exclude_activities:
-            filtered_df = filtered_df[~filtered_df['Activity'].isin(exclude_activities)]
+        filtered_df = reuse_filter_result(
+            'activity', activity_input_df, (list(selected_activities), list(exclude_activities)),
+            apply_activity_filter
+        )
             
         filter_settings['include_all_activities'] = len(selected_activities) == 0
         filter_settings['included_activities'] = selected_activities
@@ -381,7 +473,7 @@ def create_person_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]
     if 'Person' not in df.columns:
         return df, filter_settings
     
-    persons = sorted(df['Person'].unique().tolist())
+    persons = reuse_filter_result('person_options', df, None, lambda: sorted(df['Person'].unique().tolist()))
     
     current_included = st.session_state.get('person_included', [])
     current_excluded = st.session_state.get('person_excluded', [])
@@ -404,13 +496,20 @@ def create_person_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]
             on_change=trigger_rerun
         )
     
-    filtered_df = df.copy()
-    
-    if selected_persons:
-        filtered_df = filtered_df[filtered_df['Person'].isin(selected_persons)]
+    def apply_person_filter():
+        filtered_df = df
+        
+        if selected_persons:
+            filtered_df = filtered_df[filtered_df['Person'].isin(selected_persons)]
+        
+        if exclude_persons:
+            filtered_df = filtered_df[~filtered_df['Person'].isin(exclude_persons)]
+        
+        return filtered_df
     
-    if exclude_persons:
-        filtered_df = filtered_df[~filtered_df['Person'].isin(exclude_persons)]
+    filtered_df = reuse_filter_result(
+        'person', df, (list(selected_persons), list(exclude_persons)), apply_person_filter
+    )
     
     filter_settings['include_all_persons'] = len(selected_persons) == 0
     filter_settings['included_persons'] = selected_persons
@@ -441,10 +540,16 @@ def create_person_type_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str,
         )
     
     if selected_include == "Internal":
-        filtered_df = df[df['Person type'].fillna('').str.lower() == 'internal']
+        filtered_df = reuse_filter_result(
+            'person_type', df, selected_include,
+            lambda: df[df['Person type'].fillna('').str.lower() == 'internal']
+        )
         filter_settings['selected_person_type'] = 'internal'
     elif selected_include == "External":
-        filtered_df = df[df['Person type'].fillna('').str.lower() == 'external']
+        filtered_df = reuse_filter_result(
+            'person_type', df, selected_include,
+            lambda: df[df['Person type'].fillna('').str.lower() == 'external']
+        )
         filter_settings['selected_person_type'] = 'external'
     else:
         filtered_df = df
@@ -463,8 +568,11 @@ def create_project_hours_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[st
     if 'Project number' not in df.columns or 'Hours worked' not in df.columns:
         return df, filter_settings
     
-    filtered_df = df.copy()
-    project_hours = df.groupby('Project number')['Hours worked'].sum().reset_index()
+    filtered_df = df
+    project_hours = reuse_filter_result(
+        'project_hours_totals', df, None,
+        lambda: df.groupby('Project number')['Hours worked'].sum().reset_index()
+    )
     total_projects = project_hours['Project number'].nunique()
     
     current_enabled = st.session_state.get('project_hours_enabled', False)
@@ -510,7 +618,10 @@ def create_project_hours_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[st
                 st.warning("No projects found with hours in the selected range.")
                 return pd.DataFrame(columns=df.columns), filter_settings
 
-            filtered_df = filtered_df[filtered_df['Project number'].isin(valid_projects)]
+            filtered_df = reuse_filter_result(
+                'project_hours', df, valid_projects,
+                lambda: df[df['Project number'].isin(valid_projects)]
+            )
             
             filter_settings['project_min_hours'] = min_selected_hours
             filter_settings['project_max_hours'] = max_selected_hours
@@ -534,16 +645,19 @@ def create_project_effective_rate_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame
     if not all(col in df.columns for col in required_columns):
         return df, filter_settings
     
-    filtered_df = df.copy()
+    filtered_df = df
     
-    project_rates = df.groupby('Project number').apply(
-        lambda x: pd.Series({
-            'Total hours': x['Hours worked'].sum(),
-            'Revenue': (x['Billable hours'] * x['Hourly rate']).sum(),
-            'Effective rate': (x['Billable hours'] * x['Hourly rate']).sum() / x['Hours worked'].sum()
-            if x['Hours worked'].sum() > 0 else 0
-        })
-    ).reset_index()
+    project_rates = reuse_filter_result(
+        'project_rate_totals', df, None,
+        lambda: df.groupby('Project number').apply(
+            lambda x: pd.Series({
+                'Total hours': x['Hours worked'].sum(),
+                'Revenue': (x['Billable hours'] * x['Hourly rate']).sum(),
+                'Effective rate': (x['Billable hours'] * x['Hourly rate']).sum() / x['Hours worked'].sum()
+                if x['Hours worked'].sum() > 0 else 0
+            })
+        ).reset_index()
+    )
     
     total_projects = project_rates['Project number'].nunique()
     
@@ -590,7 +704,10 @@ def create_project_effective_rate_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame
                 st.warning("No projects found with effective rates in the selected range.")
                 return pd.DataFrame(columns=df.columns), filter_settings
 
-            filtered_df = filtered_df[filtered_df['Project number'].isin(valid_projects)]
+            filtered_df = reuse_filter_result(
+                'project_rate', df, valid_projects,
+                lambda: df[df['Project number'].isin(valid_projects)]
+            )
             
             filter_settings['project_min_effective_rate'] = min_selected_rate
             filter_settings['project_max_effective_rate'] = max_selected_rate
@@ -628,10 +745,14 @@ def create_billability_filter(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str,
         )
     
     if selected_include == "Billable / Partially":
-        filtered_df = df[df['Billable hours'] > 0]
+        filtered_df = reuse_filter_result(
+            'billability', df, selected_include, lambda: df[df['Billable hours'] > 0]
+        )
         filter_settings['selected_billability'] = 'billable'
     elif selected_include == "Non-billable":
-        filtered_df = df[df['Billable hours'] == 0]
+        filtered_df = reuse_filter_result(
+            'billability', df, selected_include, lambda: df[df['Billable hours'] == 0]
+        )
         filter_settings['selected_billability'] = 'non-billable'
     else:
         filtered_df = df
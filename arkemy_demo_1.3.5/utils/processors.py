@@ -1,7 +1,15 @@
 # processors.py
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Union
+from utils.chart_helpers import PROFIT_METRICS
+
+# Metrics selectable in the category charts and metrics that may be negative
+CHART_METRICS = (
+    "Hours worked", "Billable hours", "Billability %", "Billable rate", "Effective rate",
+    "Revenue", "Total cost", "Total profit", "Profit margin %"
+)
+SIGNED_METRICS = PROFIT_METRICS
 
 
 def calculate_summary_metrics(df: pd.DataFrame) -> Dict[str, Any]:
@@ -188,12 +196,12 @@ def aggregate_by_year(df: pd.DataFrame) -> pd.DataFrame:
     if "Date" not in df.columns:
         raise ValueError("Date column not found in dataframe")
     
-    # Extract year from the Date column
-    year_df = df.copy()
-    year_df['Year'] = year_df['Date'].dt.year
+    # Group once on the year of each record (no copy of the frame); every metric
+    # below reuses this grouping, so the year keys are factorized a single time
+    year_grouped = df.groupby(df['Date'].dt.year.rename('Year'))
     
     # Aggregate metrics by year
-    year_agg = year_df.groupby("Year").agg({
+    year_agg = year_grouped.agg({
         "Hours worked": "sum",
         "Billable hours": "sum",
         "Project number": "nunique",
@@ -212,28 +220,24 @@ def aggregate_by_year(df: pd.DataFrame) -> pd.DataFrame:
     
     # Add revenue (new approach with fallback)
     if "Fee per time record" in df.columns:
-        revenue_by_year = year_df.groupby("Year")["Fee per time record"].sum().reset_index(name="Revenue")
-        year_agg = pd.merge(year_agg, revenue_by_year, on="Year")
+        year_agg["Revenue"] = year_grouped["Fee per time record"].sum().to_numpy()
     elif "Hourly rate" in df.columns:
         # Fallback to old calculation
-        revenue_by_year = year_df.groupby("Year").apply(
+        year_agg["Revenue"] = year_grouped.apply(
             lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")
-        year_agg = pd.merge(year_agg, revenue_by_year, on="Year")
+        ).to_numpy()
     else:
         year_agg["Revenue"] = 0
     
     # Add cost
     if "Cost per time record" in df.columns:
-        cost_by_year = year_df.groupby("Year")["Cost per time record"].sum().reset_index(name="Total cost")
-        year_agg = pd.merge(year_agg, cost_by_year, on="Year")
+        year_agg["Total cost"] = year_grouped["Cost per time record"].sum().to_numpy()
     else:
         year_agg["Total cost"] = 0
     
     # Add profit
     if "Profit per time record" in df.columns:
-        profit_by_year = year_df.groupby("Year")["Profit per time record"].sum().reset_index(name="Total profit")
-        year_agg = pd.merge(year_agg, profit_by_year, on="Year")
+        year_agg["Total profit"] = year_grouped["Profit per time record"].sum().to_numpy()
     else:
         year_agg["Total profit"] = 0
     
@@ -274,30 +278,30 @@ def aggregate_by_customer(df: pd.DataFrame) -> pd.DataFrame:
     customer_agg["Billability %"] = (customer_agg["Billable hours"] / customer_agg["Hours worked"] * 100).round(2)
     customer_agg.rename(columns={"Project number": "Number of projects"}, inplace=True)
     
+    # Revenue, cost and profit are summed per customer number (one grouping reused
+    # for all three) and mapped onto the customer rows
+    customer_number_grouped = df.groupby("Customer number")
+    
     # Add revenue (new approach with fallback)
     if "Fee per time record" in df.columns:
-        revenue_by_customer = df.groupby("Customer number")["Fee per time record"].sum().reset_index(name="Revenue")
-        customer_agg = pd.merge(customer_agg, revenue_by_customer, on="Customer number")
+        customer_agg["Revenue"] = customer_agg["Customer number"].map(customer_number_grouped["Fee per time record"].sum()).to_numpy()
     elif "Hourly rate" in df.columns:
         # Fallback to old calculation
-        revenue_by_customer = df.groupby("Customer number").apply(
+        customer_agg["Revenue"] = customer_agg["Customer number"].map(customer_number_grouped.apply(
             lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")
-        customer_agg = pd.merge(customer_agg, revenue_by_customer, on="Customer number")
+        )).to_numpy()
     else:
         customer_agg["Revenue"] = 0
     
     # Add cost
     if "Cost per time record" in df.columns:
-        cost_by_customer = df.groupby("Customer number")["Cost per time record"].sum().reset_index(name="Total cost")
-        customer_agg = pd.merge(customer_agg, cost_by_customer, on="Customer number")
+        customer_agg["Total cost"] = customer_agg["Customer number"].map(customer_number_grouped["Cost per time record"].sum()).to_numpy()
     else:
         customer_agg["Total cost"] = 0
     
     # Add profit
     if "Profit per time record" in df.columns:
-        profit_by_customer = df.groupby("Customer number")["Profit per time record"].sum().reset_index(name="Total profit")
-        customer_agg = pd.merge(customer_agg, profit_by_customer, on="Customer number")
+        customer_agg["Total profit"] = customer_agg["Customer number"].map(customer_number_grouped["Profit per time record"].sum()).to_numpy()
     else:
         customer_agg["Total profit"] = 0
     
@@ -331,7 +335,7 @@ def aggregate_by_project(df: pd.DataFrame) -> pd.DataFrame:
     # Check if Project type column exists
     if "Project type" in df.columns:
         # Use all three columns if Project type exists
-        project_agg = df.groupby(["Project number", "Project", "Project type"]).agg({
+        project_agg = df.groupby(["Project number", "Project", "Project type"], observed=True).agg({
             "Hours worked": "sum",
             "Billable hours": "sum",
             "Person": "nunique"
@@ -350,30 +354,30 @@ def aggregate_by_project(df: pd.DataFrame) -> pd.DataFrame:
     project_agg["Billability %"] = (project_agg["Billable hours"] / project_agg["Hours worked"] * 100).round(2)
     project_agg.rename(columns={"Person": "Number of people"}, inplace=True)
     
+    # Revenue, cost and profit are summed per project number (one grouping reused
+    # for all three) and mapped onto the project rows
+    project_number_grouped = df.groupby("Project number")
+    
     # Add revenue (new approach with fallback)
     if "Fee per time record" in df.columns:
-        revenue_by_project = df.groupby("Project number")["Fee per time record"].sum().reset_index(name="Revenue")
-        project_agg = pd.merge(project_agg, revenue_by_project, on="Project number")
+        project_agg["Revenue"] = project_agg["Project number"].map(project_number_grouped["Fee per time record"].sum()).to_numpy()
     elif "Hourly rate" in df.columns:
         # Fallback to old calculation
-        revenue_by_project = df.groupby("Project number").apply(
+        project_agg["Revenue"] = project_agg["Project number"].map(project_number_grouped.apply(
             lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")
-        project_agg = pd.merge(project_agg, revenue_by_project, on="Project number")
+        )).to_numpy()
     else:
         project_agg["Revenue"] = 0
     
     # Add cost
     if "Cost per time record" in df.columns:
-        cost_by_project = df.groupby("Project number")["Cost per time record"].sum().reset_index(name="Total cost")
-        project_agg = pd.merge(project_agg, cost_by_project, on="Project number")
+        project_agg["Total cost"] = project_agg["Project number"].map(project_number_grouped["Cost per time record"].sum()).to_numpy()
     else:
         project_agg["Total cost"] = 0
     
     # Add profit
     if "Profit per time record" in df.columns:
-        profit_by_project = df.groupby("Project number")["Profit per time record"].sum().reset_index(name="Total profit")
-        project_agg = pd.merge(project_agg, profit_by_project, on="Project number")
+        project_agg["Total profit"] = project_agg["Project number"].map(project_number_grouped["Profit per time record"].sum()).to_numpy()
     else:
         project_agg["Total profit"] = 0
     
@@ -394,17 +398,38 @@ def aggregate_by_project(df: pd.DataFrame) -> pd.DataFrame:
     return project_agg
 
 
-def aggregate_by_project_type(df: pd.DataFrame) -> pd.DataFrame:
+def count_zero_groups(agg_df: pd.DataFrame) -> pd.Series:
+    """
+    Count the groups per metric that charts exclude (zero values, or non-positive
+    values for metrics that cannot be negative) in one vectorized pass.
+    
+    Args:
+        agg_df: Aggregated dataframe
+        
+    Returns:
+        Series of excluded group counts indexed by metric name
+    """
+    metrics = [metric for metric in CHART_METRICS if metric in agg_df.columns]
+    values = agg_df[metrics].to_numpy(dtype=float)
+    signed = np.isin(metrics, list(SIGNED_METRICS))
+    excluded = np.where(signed, ~(values != 0), ~(values > 0)).sum(axis=0)
+    return pd.Series(excluded, index=metrics)
+
+
+def aggregate_by_project_type(df: pd.DataFrame, return_zero_counts: bool = False) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.Series]]:
     """
     Aggregate data by project type.
     
     Args:
         df: Validated and transformed dataframe
+        return_zero_counts: Also return the per-metric count of groups charts exclude
         
     Returns:
-        Dataframe with project type aggregations
+        Dataframe with project type aggregations, plus the zero counts if requested
     """
-    project_type_agg = df.groupby(["Project type"]).agg({
+    # Group once; the revenue, cost and profit sums below reuse this grouping
+    project_type_grouped = df.groupby("Project type", observed=True)
+    project_type_agg = project_type_grouped.agg({
         "Hours worked": "sum",
         "Billable hours": "sum",
         "Project number": "nunique",
@@ -420,28 +445,24 @@ def aggregate_by_project_type(df: pd.DataFrame) -> pd.DataFrame:
     
     # Add revenue (new approach with fallback)
     if "Fee per time record" in df.columns:
-        revenue_by_type = df.groupby("Project type")["Fee per time record"].sum().reset_index(name="Revenue")
-        project_type_agg = pd.merge(project_type_agg, revenue_by_type, on="Project type")
+        project_type_agg["Revenue"] = project_type_grouped["Fee per time record"].sum().to_numpy()
     elif "Hourly rate" in df.columns:
         # Fallback to old calculation
-        revenue_by_type = df.groupby("Project type").apply(
+        project_type_agg["Revenue"] = project_type_grouped.apply(
             lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")
-        project_type_agg = pd.merge(project_type_agg, revenue_by_type, on="Project type")
+        ).to_numpy()
     else:
         project_type_agg["Revenue"] = 0
     
     # Add cost
     if "Cost per time record" in df.columns:
-        cost_by_type = df.groupby("Project type")["Cost per time record"].sum().reset_index(name="Total cost")
-        project_type_agg = pd.merge(project_type_agg, cost_by_type, on="Project type")
+        project_type_agg["Total cost"] = project_type_grouped["Cost per time record"].sum().to_numpy()
     else:
         project_type_agg["Total cost"] = 0
     
     # Add profit
     if "Profit per time record" in df.columns:
-        profit_by_type = df.groupby("Project type")["Profit per time record"].sum().reset_index(name="Total profit")
-        project_type_agg = pd.merge(project_type_agg, profit_by_type, on="Project type")
+        project_type_agg["Total profit"] = project_type_grouped["Profit per time record"].sum().to_numpy()
     else:
         project_type_agg["Total profit"] = 0
     
@@ -459,6 +480,8 @@ def aggregate_by_project_type(df: pd.DataFrame) -> pd.DataFrame:
     mask = project_type_agg["Revenue"] > 0
     project_type_agg.loc[mask, "Profit margin %"] = (project_type_agg.loc[mask, "Total profit"] / project_type_agg.loc[mask, "Revenue"] * 100).round(2)
     
+    if return_zero_counts:
+        return project_type_agg, count_zero_groups(project_type_agg)
     return project_type_agg
 
 
@@ -472,7 +495,9 @@ def aggregate_by_phase(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Dataframe with phase aggregations
     """
-    phase_agg = df.groupby(["Phase"]).agg({
+    # Group once; the revenue, cost and profit sums below reuse this grouping
+    phase_grouped = df.groupby("Phase")
+    phase_agg = phase_grouped.agg({
         "Hours worked": "sum",
         "Billable hours": "sum",
         "Project number": "nunique",
@@ -488,28 +513,24 @@ def aggregate_by_phase(df: pd.DataFrame) -> pd.DataFrame:
     
     # Add revenue (new approach with fallback)
     if "Fee per time record" in df.columns:
-        revenue_by_phase = df.groupby("Phase")["Fee per time record"].sum().reset_index(name="Revenue")
-        phase_agg = pd.merge(phase_agg, revenue_by_phase, on="Phase")
+        phase_agg["Revenue"] = phase_grouped["Fee per time record"].sum().to_numpy()
     elif "Hourly rate" in df.columns:
         # Fallback to old calculation
-        revenue_by_phase = df.groupby("Phase").apply(
+        phase_agg["Revenue"] = phase_grouped.apply(
             lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")
-        phase_agg = pd.merge(phase_agg, revenue_by_phase, on="Phase")
+        ).to_numpy()
     else:
         phase_agg["Revenue"] = 0
     
     # Add cost
     if "Cost per time record" in df.columns:
-        cost_by_phase = df.groupby("Phase")["Cost per time record"].sum().reset_index(name="Total cost")
-        phase_agg = pd.merge(phase_agg, cost_by_phase, on="Phase")
+        phase_agg["Total cost"] = phase_grouped["Cost per time record"].sum().to_numpy()
     else:
         phase_agg["Total cost"] = 0
     
     # Add profit
     if "Profit per time record" in df.columns:
-        profit_by_phase = df.groupby("Phase")["Profit per time record"].sum().reset_index(name="Total profit")
-        phase_agg = pd.merge(phase_agg, profit_by_phase, on="Phase")
+        phase_agg["Total profit"] = phase_grouped["Profit per time record"].sum().to_numpy()
     else:
         phase_agg["Total profit"] = 0
     
@@ -529,17 +550,20 @@ def aggregate_by_phase(df: pd.DataFrame) -> pd.DataFrame:
     
     return phase_agg
 
-def aggregate_by_price_model(df: pd.DataFrame) -> pd.DataFrame:
+def aggregate_by_price_model(df: pd.DataFrame, return_zero_counts: bool = False) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.Series]]:
     """
     Aggregate data by price model.
     
     Args:
         df: Validated and transformed dataframe
+        return_zero_counts: Also return the per-metric count of groups charts exclude
         
     Returns:
-        Dataframe with price model aggregations
+        Dataframe with price model aggregations, plus the zero counts if requested
     """
-    price_model_agg = df.groupby(["Price model"]).agg({
+    # Group once; the revenue, cost and profit sums below reuse this grouping
+    price_model_grouped = df.groupby("Price model", observed=True)
+    price_model_agg = price_model_grouped.agg({
         "Hours worked": "sum",
         "Billable hours": "sum",
         "Project number": "nunique",
@@ -555,28 +579,24 @@ def aggregate_by_price_model(df: pd.DataFrame) -> pd.DataFrame:
     
     # Add revenue (new approach with fallback)
     if "Fee per time record" in df.columns:
-        revenue_by_price_model = df.groupby("Price model")["Fee per time record"].sum().reset_index(name="Revenue")
-        price_model_agg = pd.merge(price_model_agg, revenue_by_price_model, on="Price model")
+        price_model_agg["Revenue"] = price_model_grouped["Fee per time record"].sum().to_numpy()
     elif "Hourly rate" in df.columns:
         # Fallback to old calculation
-        revenue_by_price_model = df.groupby("Price model").apply(
+        price_model_agg["Revenue"] = price_model_grouped.apply(
             lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")
-        price_model_agg = pd.merge(price_model_agg, revenue_by_price_model, on="Price model")
+        ).to_numpy()
     else:
         price_model_agg["Revenue"] = 0
     
     # Add cost
     if "Cost per time record" in df.columns:
-        cost_by_price_model = df.groupby("Price model")["Cost per time record"].sum().reset_index(name="Total cost")
-        price_model_agg = pd.merge(price_model_agg, cost_by_price_model, on="Price model")
+        price_model_agg["Total cost"] = price_model_grouped["Cost per time record"].sum().to_numpy()
     else:
         price_model_agg["Total cost"] = 0
     
     # Add profit
     if "Profit per time record" in df.columns:
-        profit_by_price_model = df.groupby("Price model")["Profit per time record"].sum().reset_index(name="Total profit")
-        price_model_agg = pd.merge(price_model_agg, profit_by_price_model, on="Price model")
+        price_model_agg["Total profit"] = price_model_grouped["Profit per time record"].sum().to_numpy()
     else:
         price_model_agg["Total profit"] = 0
     
@@ -594,6 +614,8 @@ def aggregate_by_price_model(df: pd.DataFrame) -> pd.DataFrame:
     mask = price_model_agg["Revenue"] > 0
     price_model_agg.loc[mask, "Profit margin %"] = (price_model_agg.loc[mask, "Total profit"] / price_model_agg.loc[mask, "Revenue"] * 100).round(2)
     
+    if return_zero_counts:
+        return price_model_agg, count_zero_groups(price_model_agg)
     return price_model_agg
 
 
@@ -607,7 +629,9 @@ def aggregate_by_activity(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Dataframe with activity aggregations
     """
-    activity_agg = df.groupby(["Activity"]).agg({
+    # Group once; the revenue, cost and profit sums below reuse this grouping
+    activity_grouped = df.groupby("Activity")
+    activity_agg = activity_grouped.agg({
         "Hours worked": "sum",
         "Billable hours": "sum",
         "Project number": "nunique",
@@ -623,28 +647,24 @@ def aggregate_by_activity(df: pd.DataFrame) -> pd.DataFrame:
     
     # Add revenue (new approach with fallback)
     if "Fee per time record" in df.columns:
-        revenue_by_activity = df.groupby("Activity")["Fee per time record"].sum().reset_index(name="Revenue")
-        activity_agg = pd.merge(activity_agg, revenue_by_activity, on="Activity")
+        activity_agg["Revenue"] = activity_grouped["Fee per time record"].sum().to_numpy()
     elif "Hourly rate" in df.columns:
         # Fallback to old calculation
-        revenue_by_activity = df.groupby("Activity").apply(
+        activity_agg["Revenue"] = activity_grouped.apply(
             lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")
-        activity_agg = pd.merge(activity_agg, revenue_by_activity, on="Activity")
+        ).to_numpy()
     else:
         activity_agg["Revenue"] = 0
     
     # Add cost
     if "Cost per time record" in df.columns:
-        cost_by_activity = df.groupby("Activity")["Cost per time record"].sum().reset_index(name="Total cost")
-        activity_agg = pd.merge(activity_agg, cost_by_activity, on="Activity")
+        activity_agg["Total cost"] = activity_grouped["Cost per time record"].sum().to_numpy()
     else:
         activity_agg["Total cost"] = 0
     
     # Add profit
     if "Profit per time record" in df.columns:
-        profit_by_activity = df.groupby("Activity")["Profit per time record"].sum().reset_index(name="Total profit")
-        activity_agg = pd.merge(activity_agg, profit_by_activity, on="Activity")
+        activity_agg["Total profit"] = activity_grouped["Profit per time record"].sum().to_numpy()
     else:
         activity_agg["Total profit"] = 0
     
@@ -675,7 +695,9 @@ def aggregate_by_person(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Dataframe with person aggregations
     """
-    person_agg = df.groupby(["Person"]).agg({
+    # Group once; the revenue, cost and profit sums below reuse this grouping
+    person_grouped = df.groupby("Person")
+    person_agg = person_grouped.agg({
         "Hours worked": "sum",
         "Billable hours": "sum",
         "Project number": "nunique"
@@ -687,28 +709,24 @@ def aggregate_by_person(df: pd.DataFrame) -> pd.DataFrame:
     
     # Add revenue (new approach with fallback)
     if "Fee per time record" in df.columns:
-        revenue_by_person = df.groupby("Person")["Fee per time record"].sum().reset_index(name="Revenue")
-        person_agg = pd.merge(person_agg, revenue_by_person, on="Person")
+        person_agg["Revenue"] = person_grouped["Fee per time record"].sum().to_numpy()
     elif "Hourly rate" in df.columns:
         # Fallback to old calculation
-        revenue_by_person = df.groupby("Person").apply(
+        person_agg["Revenue"] = person_grouped.apply(
             lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")
-        person_agg = pd.merge(person_agg, revenue_by_person, on="Person")
+        ).to_numpy()
     else:
         person_agg["Revenue"] = 0
     
     # Add cost
     if "Cost per time record" in df.columns:
-        cost_by_person = df.groupby("Person")["Cost per time record"].sum().reset_index(name="Total cost")
-        person_agg = pd.merge(person_agg, cost_by_person, on="Person")
+        person_agg["Total cost"] = person_grouped["Cost per time record"].sum().to_numpy()
     else:
         person_agg["Total cost"] = 0
     
     # Add profit
     if "Profit per time record" in df.columns:
-        profit_by_person = df.groupby("Person")["Profit per time record"].sum().reset_index(name="Total profit")
-        person_agg = pd.merge(person_agg, profit_by_person, on="Person")
+        person_agg["Total profit"] = person_grouped["Profit per time record"].sum().to_numpy()
     else:
         person_agg["Total profit"] = 0
     
@@ -900,20 +918,23 @@ def aggregate_by_month_year(df: pd.DataFrame) -> pd.DataFrame:
     if "Date" not in df.columns:
         raise ValueError("Date column not found in dataframe")
     
-    # Create month and year columns
-    month_year_df = df.copy()
-    month_year_df['Year'] = month_year_df['Date'].dt.year
-    month_year_df['Month'] = month_year_df['Date'].dt.month
+    # Create month and year keys (no copy of the frame)
+    year = df['Date'].dt.year.rename('Year')
+    month = df['Date'].dt.month.rename('Month')
     
     # Create month name for better display
     month_names = {
         1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
         7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'
     }
-    month_year_df['Month name'] = month_year_df['Month'].map(month_names)
+    month_name = month.map(month_names).rename('Month name')
+    
+    # Group once; every metric below reuses this grouping. The month name follows
+    # from the month, so the groups are the (Year, Month) pairs in sorted order
+    month_year_grouped = df.groupby([year, month, month_name])
     
     # Aggregate metrics by month and year
-    month_year_agg = month_year_df.groupby(['Year', 'Month', 'Month name']).agg({
+    month_year_agg = month_year_grouped.agg({
         "Hours worked": "sum",
         "Billable hours": "sum",
         "Project number": "nunique",
@@ -932,28 +953,24 @@ def aggregate_by_month_year(df: pd.DataFrame) -> pd.DataFrame:
     
     # Add revenue (new approach with fallback)
     if "Fee per time record" in df.columns:
-        revenue_by_month_year = month_year_df.groupby(['Year', 'Month'])["Fee per time record"].sum().reset_index(name="Revenue")
-        month_year_agg = pd.merge(month_year_agg, revenue_by_month_year, on=['Year', 'Month'])
+        month_year_agg["Revenue"] = month_year_grouped["Fee per time record"].sum().to_numpy()
     elif "Hourly rate" in df.columns:
         # Fallback to old calculation
-        revenue_by_month_year = month_year_df.groupby(['Year', 'Month']).apply(
+        month_year_agg["Revenue"] = month_year_grouped.apply(
             lambda x: (x["Billable hours"] * x["Hourly rate"]).sum()
-        ).reset_index(name="Revenue")
-        month_year_agg = pd.merge(month_year_agg, revenue_by_month_year, on=['Year', 'Month'])
+        ).to_numpy()
     else:
         month_year_agg["Revenue"] = 0
     
     # Add cost
     if "Cost per time record" in df.columns:
-        cost_by_month_year = month_year_df.groupby(['Year', 'Month'])["Cost per time record"].sum().reset_index(name="Total cost")
-        month_year_agg = pd.merge(month_year_agg, cost_by_month_year, on=['Year', 'Month'])
+        month_year_agg["Total cost"] = month_year_grouped["Cost per time record"].sum().to_numpy()
     else:
         month_year_agg["Total cost"] = 0
     
     # Add profit
     if "Profit per time record" in df.columns:
-        profit_by_month_year = month_year_df.groupby(['Year', 'Month'])["Profit per time record"].sum().reset_index(name="Total profit")
-        month_year_agg = pd.merge(month_year_agg, profit_by_month_year, on=['Year', 'Month'])
+        month_year_agg["Total profit"] = month_year_grouped["Profit per time record"].sum().to_numpy()
     else:
         month_year_agg["Total profit"] = 0
     
@@ -1,12 +1,9 @@
 #file_name.py
 # styles.py
 
-def get_tab_css():
-    """
-    Returns CSS styling for tabs with hidden radio button bullseyes.
-    Only targets navigation tabs, not sidebar radio buttons.
-    """
-    return """
+# CSS styling for tabs with hidden radio button bullseyes, built once at import.
+# Only targets navigation tabs, not sidebar radio buttons.
+TAB_CSS = """
     <style>
     /* Hide the radio button bullseye/indicator - only for navigation tabs */
     div[aria-label="Navigation"] .st-c2.st-dl.st-dm.st-dn.st-do.st-dp.st-ay.st-b3.st-dq.st-dr.st-ds.st-b5.st-dt.st-b6.st-ck.st-du.st-dv.st-d1.st-b1.st-br {
@@ -90,4 +87,11 @@ def get_tab_css():
         padding: 0rem 2rem 2rem 2rem !important;
     }
     </style>
-    """
\ No newline at end of file
+    """
+
+def get_tab_css():
+    """
+    Returns CSS styling for tabs with hidden radio button bullseyes.
+    Only targets navigation tabs, not sidebar radio buttons.
+    """
+    return TAB_CSS